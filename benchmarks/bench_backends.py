@@ -0,0 +1,56 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.acuerdo006 import Acuerdo006Calculator
+from models.backends import BACKENDS, NUMBA_AVAILABLE
+
+
+def synthetic_roster(n, seed=0):
+    rng = np.random.default_rng(seed)
+    dedication = rng.choice(["Tiempo Completo", "Medio Tiempo", "Hora Cátedra"], n)
+    return pd.DataFrame({
+        'highest_degree': rng.choice(["Pregrado", "Especialización", "Maestría", "Doctorado"], n),
+        'dedication_type': dedication,
+        'experience_years': rng.integers(0, 30, n),
+        'weekly_hours': np.where(dedication == "Hora Cátedra", rng.integers(2, 20, n), np.nan),
+        'base_year': 2024
+    })
+
+
+def timed(function, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara los backends de cálculo de nómina")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    roster = synthetic_roster(args.rows)
+    names = [name for name in BACKENDS if name != "numba" or NUMBA_AVAILABLE]
+    print(f"{args.rows} filas x {args.years} años")
+    for name in names:
+        calculator = Acuerdo006Calculator(backend=name)
+        # First call includes numba's JIT compile, reported separately
+        first = timed(lambda: calculator.simulate_roster_evolution(roster.head(1), years=1), 1)
+        evolution = timed(lambda: calculator.simulate_roster_evolution(roster, years=args.years), args.repeat)
+        projection = timed(lambda: calculator.project_roster(roster, projection_years=args.years), args.repeat)
+        print(f"{name:>6}: primera llamada {first:.2f} s, evolución {evolution:.2f} s, proyección {projection:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from models.backends import get_backend
+from models.roster import encode_roster, EXPERIENCE_LIMITS
 
 class Acuerdo006Calculator:
     
-    def __init__(self):
+    def __init__(self, backend=None, indexation=None):
+        self.rate_table_version = "Acuerdo 006 de 2018"
+        
         self.hourly_rates = {
             "Pregrado": 28000,
             "Especialización": 32000,
@@ -26,6 +30,18 @@ class Acuerdo006Calculator:
         }
         
         self.weeks_per_semester = 16
+        
+        # Yearly rate adjustment used when no indexation series is given
+        self.inflation_rate = 0.04
+        self.indexation = indexation
+        
+        # Career simulation: year at which each degree is upgraded to the next one
+        self.degree_promotion_years = {
+            "Pregrado": 2,
+            "Especialización": 4
+        }
+        
+        self.backend = get_backend(backend)
     
     def calculate_salary(self, input_data):
 
@@ -75,12 +91,12 @@ class Acuerdo006Calculator:
         }
         
         
-        inflation_rate = 0.04
         projection = []
+        factors = self.indexation_factors(base_year, projection_years, input_data.get('indexation_path'))
         
         for i in range(projection_years + 1):
             year = base_year + i
-            projected_hourly_rate = hourly_rate * ((1 + inflation_rate) ** i)
+            projected_hourly_rate = hourly_rate * float(factors[i])
             projected_base_monthly = projected_hourly_rate * weekly_hours * 4
             projected_bonus = projected_base_monthly * experience_bonus_rate
             projected_monthly = projected_base_monthly + projected_bonus
@@ -105,28 +121,98 @@ class Acuerdo006Calculator:
             'salary_projection': projection
         }
     
-    def simulate_faculty_evolution(self, faculty_data, years=10):
-        results = []
-        current_data = faculty_data.copy()
+    def indexation_factors(self, base_year, projection_years, path=None):
+        if self.indexation is None:
+            return (1 + self.inflation_rate) ** np.arange(projection_years + 1)
+        if path is None:
+            # Default to the base path; with several paths and no base the
+            # choice would be arbitrary
+            if 'base' in self.indexation.paths:
+                path = 'base'
+            elif len(self.indexation.paths) == 1:
+                path = self.indexation.paths[0]
+            else:
+                raise ValueError(
+                    f"Indexation series has paths {self.indexation.paths}; choose one with indexation_path"
+                )
+        return self.indexation.factors(base_year, projection_years, [path])[0]
+    
+    def roster_breakdown(self, roster):
+        # Vectorized salary_breakdown of calculate_salary, one row per professor
+        codes = encode_roster(self, roster)
+        hourly_rate = np.array(list(self.hourly_rates.values()))[codes['degree_code']]
+        weekly_hours = codes['weekly_hours']
+        experience_bonus_rate = np.array(list(self.experience_bonus.values()))[codes['experience_code']]
         
-        for year in range(years):
-            current_data['experience_years'] = faculty_data['experience_years'] + year
-            
-            if year == 2 and current_data['highest_degree'] == 'Pregrado':
-                current_data['highest_degree'] = 'Especialización'
-            elif year == 4 and current_data['highest_degree'] == 'Especialización':
-                current_data['highest_degree'] = 'Maestría'
-            current_data['base_year'] = faculty_data['base_year'] + year
-            calculation = self.calculate_salary(current_data)
-            
-            results.append({
-                'year': faculty_data['base_year'] + year,
-                'experience_years': current_data['experience_years'],
-                'highest_degree': current_data['highest_degree'],
-                'dedication_type': current_data['dedication_type'],
-                'hourly_rate': calculation['hourly_rate'],
-                'monthly_salary': calculation['monthly_salary'],
-                'annual_salary': calculation['annual_salary']
-            })
+        base_monthly = hourly_rate * weekly_hours * 4
+        experience_bonus_amount = base_monthly * experience_bonus_rate
+        semester_salary = hourly_rate * weekly_hours * self.weeks_per_semester
+        
+        return pd.DataFrame({
+            'hourly_rate': hourly_rate,
+            'weekly_hours': weekly_hours,
+            'base_monthly': base_monthly,
+            'experience_bonus_rate': experience_bonus_rate,
+            'experience_bonus_amount': experience_bonus_amount,
+            'monthly_salary': base_monthly + experience_bonus_amount,
+            'semester_salary': semester_salary,
+            'annual_salary': semester_salary * 2
+        }, index=roster.index)
+    
+    def project_roster(self, roster, base_year=2024, projection_years=5, indexation_path=None):
+        codes = encode_roster(self, roster)
+        hourly_rate = self.backend.rate_lookup(codes['degree_code'], np.array(list(self.hourly_rates.values()), dtype=float))
+        bonus_rate = np.array(list(self.experience_bonus.values()))[codes['experience_code']]
         
-        return pd.DataFrame(results)
+        factors = self.indexation_factors(base_year, projection_years, indexation_path)
+        
+        hourly, monthly, semester, annual = self.backend.project(
+            hourly_rate, codes['weekly_hours'], bonus_rate, factors, self.weeks_per_semester
+        )
+        
+        return pd.DataFrame({
+            'row': np.tile(np.arange(len(roster)), projection_years + 1),
+            'year': np.repeat(base_year + np.arange(projection_years + 1), len(roster)),
+            'hourly_rate': hourly.ravel(),
+            'monthly_salary': monthly.ravel(),
+            'semester_salary': semester.ravel(),
+            'annual_salary': annual.ravel()
+        })
+    
+    def simulate_roster_evolution(self, roster, years=10):
+        codes = encode_roster(self, roster)
+        degrees = list(self.hourly_rates)
+        promotion_years = np.array([self.degree_promotion_years.get(d, -1) for d in degrees])
+        experience_years = pd.to_numeric(roster['experience_years'], errors='coerce').fillna(0).to_numpy()
+        # Keep whole years as integers in the output
+        if np.all(np.mod(experience_years, 1) == 0):
+            experience_years = experience_years.astype(np.int64)
+        
+        degree_codes, hourly, monthly, annual = self.backend.evolve(
+            codes['degree_code'].astype(np.int64),
+            experience_years,
+            codes['weekly_hours'],
+            np.array(list(self.hourly_rates.values()), dtype=float),
+            np.array(list(self.experience_bonus.values())),
+            EXPERIENCE_LIMITS,
+            promotion_years,
+            years,
+            self.weeks_per_semester
+        )
+        
+        base_year = pd.to_numeric(roster['base_year'], errors='coerce').fillna(2024).to_numpy(dtype=np.int64)
+        offsets = np.arange(years)[:, None]
+        return pd.DataFrame({
+            'row': np.tile(np.arange(len(roster)), years),
+            'year': (base_year + offsets).ravel(),
+            'experience_years': (experience_years + offsets).ravel(),
+            'highest_degree': np.array(degrees)[degree_codes.ravel()],
+            'dedication_type': np.tile(roster['dedication_type'].to_numpy(), years),
+            'hourly_rate': hourly.ravel(),
+            'monthly_salary': monthly.ravel(),
+            'annual_salary': annual.ravel()
+        })
+    
+    def simulate_faculty_evolution(self, faculty_data, years=10):
+        evolution = self.simulate_roster_evolution(pd.DataFrame([faculty_data]), years=years)
+        return evolution.drop(columns='row')
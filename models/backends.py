@@ -0,0 +1,184 @@
+import numpy as np
+
+import importlib.util
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+class NumpyBackend:
+
+    name = "numpy"
+
+    def rate_lookup(self, degree_codes, rate_table):
+        return np.asarray(rate_table)[degree_codes]
+
+    def bonus_bucket(self, experience_years, limits):
+        return np.searchsorted(limits, experience_years, side='left')
+
+    def project(self, hourly_rate, weekly_hours, bonus_rate, factors, weeks_per_semester):
+        projected_hourly = np.multiply.outer(factors, hourly_rate)
+        projected_base_monthly = projected_hourly * weekly_hours * 4
+        projected_monthly = projected_base_monthly + projected_base_monthly * bonus_rate
+        projected_semester = projected_hourly * weekly_hours * weeks_per_semester
+        return projected_hourly, projected_monthly, projected_semester, projected_semester * 2
+
+    def evolution_step(self, degree_codes, year, promotion_years):
+        return np.where(promotion_years[degree_codes] == year, degree_codes + 1, degree_codes)
+
+    def evolve(self, degree_codes, experience_years, weekly_hours, rate_table, bonus_table, limits,
+               promotion_years, years, weeks_per_semester):
+        degree_codes = np.asarray(degree_codes)
+        n = degree_codes.shape[0]
+        degrees = np.empty((years, n), dtype=degree_codes.dtype)
+        hourly = np.empty((years, n))
+        monthly = np.empty((years, n))
+        annual = np.empty((years, n))
+
+        current = degree_codes
+        for year in range(years):
+            current = self.evolution_step(current, year, promotion_years)
+            rate = self.rate_lookup(current, rate_table)
+            bonus = bonus_table[self.bonus_bucket(experience_years + year, limits)]
+            base_monthly = rate * weekly_hours * 4
+            degrees[year] = current
+            hourly[year] = rate
+            monthly[year] = base_monthly + base_monthly * bonus
+            annual[year] = rate * weekly_hours * weeks_per_semester * 2
+        return degrees, hourly, monthly, annual
+
+
+_numba_kernels = {}
+
+
+def _build_numba_kernels():
+    # Imported and compiled on first use, so importing this module (and
+    # the Streamlit page) never pays for numba
+    import numba
+
+    @numba.njit(cache=True, parallel=True)
+    def _rate_lookup(degree_codes, rate_table):
+        out = np.empty(degree_codes.shape[0], dtype=rate_table.dtype)
+        for i in numba.prange(degree_codes.shape[0]):
+            out[i] = rate_table[degree_codes[i]]
+        return out
+
+    @numba.njit(cache=True)
+    def _bucket(value, limits):
+        bucket = 0
+        while bucket < limits.shape[0] and value > limits[bucket]:
+            bucket += 1
+        return bucket
+
+    @numba.njit(cache=True, parallel=True)
+    def _bonus_bucket(experience_years, limits):
+        out = np.empty(experience_years.shape[0], dtype=np.int64)
+        for i in numba.prange(experience_years.shape[0]):
+            out[i] = _bucket(experience_years[i], limits)
+        return out
+
+    @numba.njit(cache=True, parallel=True)
+    def _project(hourly_rate, weekly_hours, bonus_rate, factors, weeks_per_semester):
+        n = hourly_rate.shape[0]
+        years = factors.shape[0]
+        projected_hourly = np.empty((years, n))
+        projected_monthly = np.empty((years, n))
+        projected_semester = np.empty((years, n))
+        for i in numba.prange(n):
+            for year in range(years):
+                rate = hourly_rate[i] * factors[year]
+                base_monthly = rate * weekly_hours[i] * 4
+                projected_hourly[year, i] = rate
+                projected_monthly[year, i] = base_monthly + base_monthly * bonus_rate[i]
+                projected_semester[year, i] = rate * weekly_hours[i] * weeks_per_semester
+        return projected_hourly, projected_monthly, projected_semester, projected_semester * 2
+
+    @numba.njit(cache=True, parallel=True)
+    def _evolution_step(degree_codes, year, promotion_years):
+        out = degree_codes.copy()
+        for i in numba.prange(degree_codes.shape[0]):
+            if promotion_years[degree_codes[i]] == year:
+                out[i] = degree_codes[i] + 1
+        return out
+
+    @numba.njit(cache=True, parallel=True)
+    def _evolve(degree_codes, experience_years, weekly_hours, rate_table, bonus_table, limits,
+                promotion_years, years, weeks_per_semester):
+        n = degree_codes.shape[0]
+        degrees = np.empty((years, n), dtype=degree_codes.dtype)
+        hourly = np.empty((years, n))
+        monthly = np.empty((years, n))
+        annual = np.empty((years, n))
+        # Each professor's career is independent, so the year loop runs
+        # inside the per-professor loop and state stays in registers
+        for i in numba.prange(n):
+            degree = degree_codes[i]
+            for year in range(years):
+                if promotion_years[degree] == year:
+                    degree += 1
+                rate = rate_table[degree]
+                bonus = bonus_table[_bucket(experience_years[i] + year, limits)]
+                base_monthly = rate * weekly_hours[i] * 4
+                degrees[year, i] = degree
+                hourly[year, i] = rate
+                monthly[year, i] = base_monthly + base_monthly * bonus
+                annual[year, i] = rate * weekly_hours[i] * weeks_per_semester * 2
+        return degrees, hourly, monthly, annual
+
+    _numba_kernels.update({
+        'rate_lookup': _rate_lookup,
+        'bonus_bucket': _bonus_bucket,
+        'project': _project,
+        'evolution_step': _evolution_step,
+        'evolve': _evolve
+    })
+
+
+class NumbaBackend:
+
+    name = "numba"
+
+    def __init__(self):
+        if not NUMBA_AVAILABLE:
+            raise ImportError("numba is not installed")
+        if not _numba_kernels:
+            _build_numba_kernels()
+
+    def rate_lookup(self, degree_codes, rate_table):
+        return _numba_kernels['rate_lookup'](np.asarray(degree_codes), np.asarray(rate_table))
+
+    def bonus_bucket(self, experience_years, limits):
+        return _numba_kernels['bonus_bucket'](np.asarray(experience_years, dtype=np.float64), np.asarray(limits, dtype=np.float64))
+
+    def project(self, hourly_rate, weekly_hours, bonus_rate, factors, weeks_per_semester):
+        return _numba_kernels['project'](
+            np.asarray(hourly_rate, dtype=np.float64), np.asarray(weekly_hours, dtype=np.float64),
+            np.asarray(bonus_rate, dtype=np.float64), np.asarray(factors, dtype=np.float64), weeks_per_semester
+        )
+
+    def evolution_step(self, degree_codes, year, promotion_years):
+        return _numba_kernels['evolution_step'](np.asarray(degree_codes), year, np.asarray(promotion_years))
+
+    def evolve(self, degree_codes, experience_years, weekly_hours, rate_table, bonus_table, limits,
+               promotion_years, years, weeks_per_semester):
+        return _numba_kernels['evolve'](
+            np.asarray(degree_codes), np.asarray(experience_years, dtype=np.float64),
+            np.asarray(weekly_hours, dtype=np.float64), np.asarray(rate_table, dtype=np.float64),
+            np.asarray(bonus_table, dtype=np.float64), np.asarray(limits, dtype=np.float64),
+            np.asarray(promotion_years), years, weeks_per_semester
+        )
+
+
+BACKENDS = {
+    "numpy": NumpyBackend,
+    "numba": NumbaBackend
+}
+
+
+def get_backend(name=None):
+    # numba is opt-in: benchmarks/bench_backends.py shows no clear win over
+    # NumPy yet, and its first call pays the JIT compile
+    if name is None:
+        name = "numpy"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name}")
+    return BACKENDS[name]()
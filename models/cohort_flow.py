@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+from models.acuerdo006 import Acuerdo006Calculator
+from models.roster import encode_roster, DEFAULT_CATEDRA_HOURS
+
+# Years spent in each experience bucket before moving to the next one
+EXPERIENCE_BUCKET_YEARS = [3, 3, 5, None]
+
+DEFAULT_DEGREE_UPGRADE_RATES = {
+    "Pregrado": 0.10,
+    "Especialización": 0.08,
+    "Maestría": 0.05,
+    "Doctorado": 0.0
+}
+
+
+class CohortFlowProjector:
+
+    def __init__(self, calculator=None, attrition_rate=0.10, degree_upgrade_rates=None,
+                 dedication_transitions=None, catedra_hours=DEFAULT_CATEDRA_HOURS):
+        self.calculator = calculator or Acuerdo006Calculator()
+        self.degrees = list(self.calculator.hourly_rates)
+        self.experience_buckets = list(self.calculator.experience_bonus)
+        self.dedications = list(self.calculator.dedication_types)
+        self.shape = (len(self.degrees), len(self.experience_buckets), len(self.dedications))
+        self.n_states = int(np.prod(self.shape))
+
+        self.attrition_rate = attrition_rate
+        self.degree_upgrade_rates = DEFAULT_DEGREE_UPGRADE_RATES if degree_upgrade_rates is None else degree_upgrade_rates
+        self.dedication_transitions = dedication_transitions or {}
+        self.catedra_hours = catedra_hours
+
+        self.transition_matrix = self._build_transition_matrix()
+        self.state_annual_cost = self._build_state_costs()
+
+    def state_index(self, highest_degree, experience_bucket, dedication_type):
+        return int(np.ravel_multi_index(
+            (self.degrees.index(highest_degree),
+             self.experience_buckets.index(experience_bucket),
+             self.dedications.index(dedication_type)),
+            self.shape
+        ))
+
+    def states(self):
+        degree, experience, dedication = np.unravel_index(np.arange(self.n_states), self.shape)
+        return pd.DataFrame({
+            'highest_degree': np.array(self.degrees)[degree],
+            'experience_bucket': np.array(self.experience_buckets)[experience],
+            'dedication_type': np.array(self.dedications)[dedication],
+            'annual_cost': self.state_annual_cost
+        })
+
+    def _build_transition_matrix(self):
+        degree_matrix = np.eye(len(self.degrees))
+        for i, degree in enumerate(self.degrees[:-1]):
+            rate = self.degree_upgrade_rates.get(degree, 0.0)
+            if not 0 <= rate <= 1:
+                raise ValueError(f"Invalid upgrade rate for {degree}: {rate}")
+            degree_matrix[i, i] = 1 - rate
+            degree_matrix[i, i + 1] = rate
+
+        experience_matrix = np.eye(len(self.experience_buckets))
+        for i, years in enumerate(EXPERIENCE_BUCKET_YEARS):
+            if years:
+                experience_matrix[i, i] = 1 - 1 / years
+                experience_matrix[i, i + 1] = 1 / years
+
+        dedication_matrix = np.eye(len(self.dedications))
+        for origin, targets in self.dedication_transitions.items():
+            i = self.dedications.index(origin)
+            for target, rate in targets.items():
+                j = self.dedications.index(target)
+                if i == j or not 0 <= rate <= 1:
+                    raise ValueError(f"Invalid dedication transition {origin} -> {target}: {rate}")
+                dedication_matrix[i, j] += rate
+                dedication_matrix[i, i] -= rate
+            if dedication_matrix[i, i] < 0:
+                raise ValueError(f"Dedication transitions from {origin} add up to more than 1")
+
+        # State order matches np.ravel_multi_index over (degree, experience, dedication)
+        transition = np.kron(np.kron(degree_matrix, experience_matrix), dedication_matrix)
+
+        attrition = np.broadcast_to(np.asarray(self.attrition_rate, dtype=float), (self.n_states,))
+        if ((attrition < 0) | (attrition > 1)).any():
+            raise ValueError("Attrition rates must be between 0 and 1")
+        survival = 1 - attrition
+        return transition * survival[:, None]
+
+    def _build_state_costs(self):
+        degree, experience, dedication = np.unravel_index(np.arange(self.n_states), self.shape)
+        hourly_rates = np.array(list(self.calculator.hourly_rates.values()), dtype=float)
+        # Hora Cátedra states carry their own hour-weighted population, so
+        # only the fixed dedications have hours per state
+        fixed_hours = np.array(
+            [np.nan if h is None else h for h in self.calculator.dedication_types.values()], dtype=float
+        )
+        self.catedra_states = np.isnan(fixed_hours[dedication])
+        self.state_fixed_hours = np.where(self.catedra_states, self.catedra_hours, fixed_hours[dedication])
+        # Same annual amount as calculate_salary: two semesters of teaching weeks
+        self.state_cost_per_hour = hourly_rates[degree] * self.calculator.weeks_per_semester * 2
+        return self.state_cost_per_hour * self.state_fixed_hours
+
+    def population_from_roster(self, roster):
+        # Returns the headcount per state and the total weekly hours per
+        # state, so Hora Cátedra states are costed with the declared hours
+        codes = encode_roster(self.calculator, roster)
+        # Unknown dedications are paid 40 hours, i.e. as Tiempo Completo
+        dedication = np.where(codes['dedication_code'] < 0, self.dedications.index('Tiempo Completo'),
+                              codes['dedication_code'])
+        states = np.ravel_multi_index((codes['degree_code'], codes['experience_code'], dedication), self.shape)
+        population = np.bincount(states, minlength=self.n_states).astype(float)
+        hours = np.bincount(states, codes['weekly_hours'], minlength=self.n_states)
+        return population, hours
+
+    def hire_vector(self, hires_by_state):
+        hires = np.zeros(self.n_states)
+        for (highest_degree, experience_bucket, dedication_type), count in hires_by_state.items():
+            hires[self.state_index(highest_degree, experience_bucket, dedication_type)] += count
+        return hires
+
+    def project(self, initial_population, years=30, base_year=2024, hires=None, initial_hours=None,
+                hire_hours=None, indexation_path=None, factors=None):
+        # initial_hours / hire_hours: total weekly hours per state, as
+        # returned by population_from_roster; Hora Cátedra states default
+        # to catedra_hours per person. Costs are indexed with the
+        # calculator's factors unless an array of years + 1 factors is given
+        population = np.asarray(initial_population, dtype=float)
+        if hires is None:
+            hires = np.zeros(self.n_states)
+        hires = np.broadcast_to(np.asarray(hires, dtype=float), (years, self.n_states))
+        if initial_hours is None:
+            initial_hours = population * self.state_fixed_hours
+        if hire_hours is None:
+            hire_hours = hires * self.state_fixed_hours
+        hire_hours = np.broadcast_to(np.asarray(hire_hours, dtype=float), (years, self.n_states))
+
+        populations = np.empty((years + 1, self.n_states))
+        catedra_hours = np.zeros((years + 1, self.n_states))
+        populations[0] = population
+        catedra_hours[0] = np.where(self.catedra_states, initial_hours, 0.0)
+        for year in range(years):
+            populations[year + 1] = populations[year] @ self.transition_matrix + hires[year]
+            # Hours stay with professors moving between Hora Cátedra states;
+            # those arriving from a fixed dedication get catedra_hours
+            arriving = (populations[year] * ~self.catedra_states) @ self.transition_matrix * self.catedra_hours
+            moved = catedra_hours[year] @ self.transition_matrix + arriving + hire_hours[year]
+            catedra_hours[year + 1] = np.where(self.catedra_states, moved, 0.0)
+
+        hours = np.where(self.catedra_states, catedra_hours, populations * self.state_fixed_hours)
+        if factors is None:
+            factors = self.calculator.indexation_factors(base_year, years, indexation_path)
+        factors = np.asarray(factors, dtype=float)
+        if factors.shape != (years + 1,):
+            raise ValueError(f"Expected {years + 1} indexation factors, got {factors.shape}")
+        state_costs = hours * self.state_cost_per_hour * factors[:, None]
+
+        by_dedication = state_costs.reshape(years + 1, -1, len(self.dedications)).sum(axis=1)
+        headcount_by_dedication = populations.reshape(years + 1, -1, len(self.dedications)).sum(axis=1)
+        total = by_dedication.sum(axis=1)
+
+        projection = pd.DataFrame({
+            'year': base_year + np.arange(years + 1),
+            'headcount': populations.sum(axis=1),
+            'total_ocasional': total
+        })
+        for i, dedication in enumerate(self.dedications):
+            key = dedication.lower().replace(' ', '_').replace('á', 'a')
+            projection[f'headcount_{key}'] = headcount_by_dedication[:, i]
+            projection[f'total_{key}'] = by_dedication[:, i]
+            projection[f'{key}_percentage'] = np.divide(
+                by_dedication[:, i] * 100, total, out=np.zeros_like(total), where=total > 0
+            )
+
+        return projection, populations
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+from models.acuerdo006 import Acuerdo006Calculator
+from models.roster import encode_roster
+
+# Monday to Friday
+DEFAULT_TEACHING_WEEKDAYS = (0, 1, 2, 3, 4)
+
+PERIOD_TYPES = ('term', 'holiday')
+
+
+def _parse_dates(values, labels, what):
+    # Missing or unparseable dates would silently count zero days
+    dates = pd.to_datetime(values, errors='coerce')
+    invalid = dates.isna()
+    if invalid.any():
+        raise ValueError(f"Invalid or missing {what} in rows {list(labels[np.asarray(invalid)])}")
+    return dates.to_numpy().astype('datetime64[D]')
+
+
+class AcademicCalendar:
+
+    def __init__(self, periods, teaching_weekdays=DEFAULT_TEACHING_WEEKDAYS):
+        # periods: DataFrame with start, end and type ('term' or 'holiday'),
+        # both dates inclusive
+        starts = _parse_dates(periods['start'], periods.index, 'start')
+        ends = _parse_dates(periods['end'], periods.index, 'end')
+        kinds = periods['type'].astype(str).str.strip().str.lower().to_numpy()
+        unknown = ~np.isin(kinds, PERIOD_TYPES)
+        if unknown.any():
+            raise ValueError(
+                f"Unknown period type {sorted(set(kinds[unknown]))} in rows {list(periods.index[unknown])}; "
+                f"expected one of {PERIOD_TYPES}"
+            )
+
+        self.origin = starts.min()
+        n_days = int((ends.max() - self.origin).astype(np.int64)) + 1
+
+        # Mark term days and remove holidays with difference arrays, so
+        # building the index is linear in days + periods
+        marks = {}
+        for kind in PERIOD_TYPES:
+            start = (starts[kinds == kind] - self.origin).astype(np.int64)
+            end = (ends[kinds == kind] - self.origin).astype(np.int64)
+            diff = np.zeros(n_days + 1, dtype=np.int64)
+            np.add.at(diff, start, 1)
+            np.add.at(diff, end + 1, -1)
+            marks[kind] = np.cumsum(diff[:-1]) > 0
+
+        days = self.origin + np.arange(n_days)
+        # 1970-01-01 was a Thursday
+        weekday = (days.astype(np.int64) + 3) % 7
+        teaching = marks['term'] & ~marks['holiday'] & np.isin(weekday, teaching_weekdays)
+
+        self.n_days = n_days
+        self.days_per_week = len(teaching_weekdays)
+        self.teaching = teaching
+        self.cumulative = np.concatenate([[0], np.cumsum(teaching)])
+
+    @classmethod
+    def from_csv(cls, path, **kwargs):
+        return cls(pd.read_csv(path), **kwargs)
+
+    def _day_offsets(self, dates):
+        return (np.asarray(dates, dtype='datetime64[D]') - self.origin).astype(np.int64)
+
+    def teaching_days(self, start, end):
+        # Inclusive range of dates; days outside the calendar never count
+        first = np.clip(self._day_offsets(start), 0, self.n_days)
+        last = np.clip(self._day_offsets(end) + 1, 0, self.n_days)
+        return np.where(last > first, self.cumulative[last] - self.cumulative[first], 0)
+
+
+class ProratedPayrollEngine:
+
+    def __init__(self, calendar, calculator=None):
+        self.calendar = calendar
+        self.calculator = calculator or Acuerdo006Calculator()
+        self.hourly_rates = np.array(list(self.calculator.hourly_rates.values()), dtype=float)
+        self.experience_bonus = np.array(list(self.calculator.experience_bonus.values()), dtype=float)
+
+    def monthly_payroll(self, roster):
+        # roster needs contract_start and contract_end besides the usual
+        # calculate_salary fields
+        codes = encode_roster(self.calculator, roster)
+        hourly_rate = self.hourly_rates[codes['degree_code']]
+        weekly_hours = codes['weekly_hours']
+        bonus_rate = self.experience_bonus[codes['experience_code']]
+
+        start = _parse_dates(roster['contract_start'], roster.index, 'contract_start')
+        end = _parse_dates(roster['contract_end'], roster.index, 'contract_end')
+
+        # One output row per contract and calendar month it touches
+        first_month = start.astype('datetime64[M]')
+        n_months = np.maximum((end.astype('datetime64[M]') - first_month).astype(np.int64) + 1, 0)
+        row = np.repeat(np.arange(len(roster)), n_months)
+        offset = np.arange(row.size) - np.repeat(np.cumsum(n_months) - n_months, n_months)
+
+        month = first_month[row] + offset
+        month_start = month.astype('datetime64[D]')
+        month_end = (month + 1).astype('datetime64[D]') - 1
+        days = self.calendar.teaching_days(np.maximum(start[row], month_start), np.minimum(end[row], month_end))
+
+        teaching_weeks = days / self.calendar.days_per_week
+        # A 4-week month pays exactly calculate_salary's monthly_salary
+        payable = hourly_rate[row] * weekly_hours[row] * teaching_weeks * (1 + bonus_rate[row])
+
+        return pd.DataFrame({
+            'row': row,
+            'month': month,
+            'teaching_days': days,
+            'teaching_weeks': teaching_weeks,
+            'payable': payable
+        })
+
+    def contract_totals(self, roster):
+        monthly = self.monthly_payroll(roster)
+        return pd.DataFrame({
+            'teaching_weeks': np.bincount(monthly['row'], monthly['teaching_weeks'], minlength=len(roster)),
+            'payable': np.bincount(monthly['row'], monthly['payable'], minlength=len(roster))
+        }, index=roster.index)
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+from models.acuerdo006 import Acuerdo006Calculator
+from models.roster import encode_roster
+
+# Rates are stored as basis points and hours as hundredths of an hour so
+# every step stays in integers
+BASIS_POINTS = 10000
+HOURS_SCALE = 100
+
+
+def round_half_up(numerator, denominator):
+    # Integer division rounding .5 away from zero, for non-negative amounts
+    numerator = np.asarray(numerator, dtype=np.int64)
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def to_scaled_hours(weekly_hours):
+    scaled = np.rint(np.asarray(weekly_hours, dtype=np.float64) * HOURS_SCALE)
+    if not np.allclose(scaled, np.asarray(weekly_hours, dtype=np.float64) * HOURS_SCALE, rtol=0, atol=1e-6):
+        raise ValueError(f"Weekly hours must be multiples of 1/{HOURS_SCALE} of an hour")
+    return scaled.astype(np.int64)
+
+
+class ExactPayrollCalculator:
+
+    def __init__(self, calculator=None):
+        self.calculator = calculator or Acuerdo006Calculator()
+
+        self.hourly_rates = np.array(list(self.calculator.hourly_rates.values()), dtype=np.int64)
+        self.experience_bonus_bp = np.array(
+            [round(rate * BASIS_POINTS) for rate in self.calculator.experience_bonus.values()],
+            dtype=np.int64
+        )
+        self.weeks_per_semester = self.calculator.weeks_per_semester
+
+    def _amounts(self, hourly_rate, scaled_hours, bonus_bp):
+        # Rounding rules:
+        #   monthly base and semester are rounded half-up to the peso once
+        #   (they are exact for whole hours)
+        #   experience bonus is rounded half-up to the peso once, on the monthly base
+        #   annual is two semesters
+        base_monthly = round_half_up(hourly_rate * scaled_hours * 4, HOURS_SCALE)
+        experience_bonus_amount = round_half_up(base_monthly * bonus_bp, BASIS_POINTS)
+        semester_salary = round_half_up(hourly_rate * scaled_hours * self.weeks_per_semester, HOURS_SCALE)
+        return {
+            'hourly_rate': hourly_rate,
+            'base_monthly': base_monthly,
+            'experience_bonus_amount': experience_bonus_amount,
+            'monthly_salary': base_monthly + experience_bonus_amount,
+            'semester_salary': semester_salary,
+            'annual_salary': semester_salary * 2
+        }
+
+    def yearly_adjustments_bp(self, base_year, projection_years, indexation_path=None, factors=None):
+        # Year-over-year adjustment in basis points, taken from the same
+        # indexation factors as the float calculator
+        if factors is None:
+            factors = self.calculator.indexation_factors(base_year, projection_years, indexation_path)
+        factors = np.asarray(factors, dtype=float)
+        return np.rint((factors[1:] / factors[:-1] - 1) * BASIS_POINTS).astype(np.int64)
+
+    def projected_hourly_rates(self, hourly_rate, projection_years, base_year=2024, indexation_path=None,
+                               factors=None):
+        # Yearly indexation is applied to the previous year's published
+        # rate and rounded half-up to the peso, so every year is an integer
+        adjustments = self.yearly_adjustments_bp(base_year, projection_years, indexation_path, factors)
+        rates = [np.asarray(hourly_rate, dtype=np.int64)]
+        for adjustment_bp in adjustments:
+            rates.append(round_half_up(rates[-1] * (BASIS_POINTS + adjustment_bp), BASIS_POINTS))
+        return np.stack(rates)
+
+    def calculate(self, roster):
+        codes = encode_roster(self.calculator, roster)
+        hourly_rate = self.hourly_rates[codes['degree_code']]
+        bonus_bp = self.experience_bonus_bp[codes['experience_code']]
+
+        amounts = self._amounts(hourly_rate, to_scaled_hours(codes['weekly_hours']), bonus_bp)
+        result = pd.DataFrame({'weekly_hours': codes['weekly_hours'], **amounts}, index=roster.index)
+        result['experience_bonus_bp'] = bonus_bp
+        return result
+
+    def project(self, roster, base_year=2024, projection_years=5, indexation_path=None, factors=None):
+        codes = encode_roster(self.calculator, roster)
+        bonus_bp = self.experience_bonus_bp[codes['experience_code']]
+        rates = self.projected_hourly_rates(
+            self.hourly_rates[codes['degree_code']], projection_years, base_year, indexation_path, factors
+        )
+        scaled_hours = to_scaled_hours(codes['weekly_hours'])
+
+        frames = []
+        for i, hourly_rate in enumerate(rates):
+            amounts = self._amounts(hourly_rate, scaled_hours, bonus_bp)
+            frames.append(pd.DataFrame({
+                'row': np.arange(len(roster)),
+                'year': base_year + i,
+                'hourly_rate': amounts['hourly_rate'],
+                'monthly_salary': amounts['monthly_salary'],
+                'semester_salary': amounts['semester_salary'],
+                'annual_salary': amounts['annual_salary']
+            }))
+        return pd.concat(frames, ignore_index=True)
+
+    def totals(self, roster, chunk_size=None):
+        # Integer sums are associative, so the result is identical for any
+        # chunking or machine
+        columns = ['base_monthly', 'experience_bonus_amount', 'monthly_salary', 'semester_salary', 'annual_salary']
+        totals = dict.fromkeys(columns, 0)
+        chunk_size = chunk_size or max(len(roster), 1)
+
+        for start in range(0, len(roster), chunk_size):
+            chunk = self.calculate(roster.iloc[start:start + chunk_size])
+            for column in columns:
+                totals[column] += int(chunk[column].sum())
+
+        totals['count'] = len(roster)
+        return totals
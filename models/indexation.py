@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+
+class IndexationSeries:
+
+    def __init__(self, rates):
+        # rates: DataFrame indexed by year with one column per path. The rate
+        # listed for a year is the adjustment applied going from the previous
+        # year into that year. Years must be consecutive.
+        rates = rates.sort_index()
+        years = rates.index.to_numpy(dtype=np.int64)
+        if len(years) and not np.array_equal(years, np.arange(years[0], years[0] + len(years))):
+            raise ValueError("Indexation years must be consecutive")
+        if rates.isna().any().any():
+            raise ValueError("Indexation series has missing rates")
+
+        self.paths = list(rates.columns)
+        self.first_year = int(years[0]) if len(years) else 0
+        self.last_year = int(years[-1]) if len(years) else -1
+        self.rates = rates.to_numpy(dtype=float).T
+
+        # cumulative[p, k]: growth of path p from the first year up to year
+        # first_year + k, so any projection is one slice and one division
+        self.cumulative = np.concatenate(
+            [np.ones((len(self.paths), 1)), np.cumprod(1 + self.rates[:, 1:], axis=1)], axis=1
+        )
+
+    @classmethod
+    def from_csv(cls, path, percent=False):
+        # CSV with a year column and one column of yearly rates per path,
+        # e.g. year,base,optimistic,pessimistic
+        rates = pd.read_csv(path).set_index('year')
+        if percent:
+            rates = rates / 100
+        return cls(rates)
+
+    @classmethod
+    def constant(cls, rate, first_year, last_year, path='base'):
+        years = np.arange(first_year, last_year + 1)
+        return cls(pd.DataFrame({path: np.full(len(years), rate)}, index=years))
+
+    def sampled(self, n_paths, volatility=0.01, path='base', from_year=None, seed=None):
+        # Random paths around one path; years before from_year keep the
+        # historic rates
+        rng = np.random.default_rng(seed)
+        base = self.rates[self.paths.index(path)]
+        start = 0 if from_year is None else max(from_year - self.first_year, 0)
+        noise = rng.normal(0.0, volatility, size=(n_paths, len(base)))
+        noise[:, :start] = 0.0
+        years = np.arange(self.first_year, self.last_year + 1)
+        return IndexationSeries(pd.DataFrame(
+            (base + noise).T, index=years, columns=[f'{path}_{i}' for i in range(n_paths)]
+        ))
+
+    def factors(self, base_year, years, paths=None):
+        # Array of shape (paths, years + 1) with the factor from base_year
+        # to each projected year; factors[:, 0] is always 1
+        start = base_year - self.first_year
+        if start < 0 or base_year + years > self.last_year:
+            raise ValueError(
+                f"Indexation series covers {self.first_year}-{self.last_year}, "
+                f"cannot project {base_year}-{base_year + years}"
+            )
+        cumulative = self.cumulative if paths is None else self.cumulative[[self.paths.index(p) for p in paths]]
+        window = cumulative[:, start:start + years + 1]
+        return window / window[:, :1]
+
+    def project(self, amounts, base_year, years, paths=None):
+        # One broadcasted pass: (paths, rows, years + 1)
+        factors = self.factors(base_year, years, paths)
+        return factors[:, None, :] * np.asarray(amounts, dtype=float)[None, :, None]
+
+    def project_totals(self, amounts, base_year, years, paths=None):
+        # Indexation is linear, so roster totals only need the summed amount
+        factors = self.factors(base_year, years, paths)
+        return pd.DataFrame(
+            factors.T * float(np.sum(amounts)),
+            index=pd.Index(np.arange(base_year, base_year + years + 1), name='year'),
+            columns=self.paths if paths is None else list(paths)
+        )
@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+from models.acuerdo006 import Acuerdo006Calculator
+
+DEFAULT_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+# Label for rows whose degree or dedication was not recognized
+UNKNOWN_LABEL = "No reconocido"
+
+
+class QuantileSketch:
+    # Log-bucketed histogram: every value in a bucket is within
+    # relative_accuracy of the bucket's representative value, and two
+    # sketches with the same settings merge by adding counts
+
+    def __init__(self, relative_accuracy=0.01, min_value=1.0, max_value=1e11, n_series=1):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = np.log(self.gamma)
+        self.min_value = min_value
+        self.offset = int(np.ceil(np.log(min_value) / self.log_gamma))
+        n_buckets = int(np.ceil(np.log(max_value) / self.log_gamma)) - self.offset + 2
+        self.counts = np.zeros((n_series, n_buckets), dtype=np.int64)
+
+    def _compatible(self, other):
+        return (self.relative_accuracy == other.relative_accuracy and self.min_value == other.min_value
+                and self.counts.shape == other.counts.shape)
+
+    def update(self, values, series=None):
+        values = np.asarray(values, dtype=float)
+        # Bucket 0 holds everything at or below min_value
+        buckets = np.ceil(np.log(np.maximum(values, self.min_value)) / self.log_gamma).astype(np.int64)
+        buckets = np.clip(buckets - self.offset + 1, 0, self.counts.shape[1] - 1)
+        buckets[values <= self.min_value] = 0
+        series = np.zeros(len(values), dtype=np.int64) if series is None else np.asarray(series, dtype=np.int64)
+        flat = series * self.counts.shape[1] + buckets
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+
+    def merge(self, other):
+        if not self._compatible(other):
+            raise ValueError("Cannot merge sketches with different settings")
+        self.counts += other.counts
+        return self
+
+    def quantiles(self, quantiles, series=None):
+        counts = self.counts.sum(axis=0) if series is None else self.counts[series]
+        total = counts.sum()
+        if total == 0:
+            return {q: None for q in quantiles}
+        cumulative = np.cumsum(counts)
+        ranks = np.asarray(quantiles) * (total - 1)
+        buckets = np.searchsorted(cumulative, ranks, side='right')
+        values = 2 * self.gamma ** (buckets + self.offset - 1) / (self.gamma + 1)
+        values = np.where(buckets == 0, self.min_value, values)
+        return {q: float(v) for q, v in zip(quantiles, values)}
+
+
+class PayrollStatsAccumulator:
+
+    def __init__(self, calculator=None, relative_accuracy=0.01, quantiles=DEFAULT_QUANTILES):
+        calculator = calculator or Acuerdo006Calculator()
+        self.degrees = list(calculator.hourly_rates)
+        self.dedications = list(calculator.dedication_types)
+        self.quantiles = tuple(quantiles)
+
+        # Last row/column collects unrecognized labels
+        shape = (len(self.degrees) + 1, len(self.dedications) + 1)
+        self.counts = np.zeros(shape, dtype=np.int64)
+        self.total_monthly = np.zeros(shape, dtype=np.int64)
+        self.total_annual = np.zeros(shape, dtype=np.int64)
+        self.monthly_sketch = QuantileSketch(relative_accuracy, n_series=len(self.dedications) + 1)
+
+    def _codes(self, values, categories):
+        codes = pd.Categorical(values, categories=categories).codes.astype(np.int64)
+        return np.where(codes < 0, len(categories), codes)
+
+    def update(self, chunk):
+        # chunk: one row per professor with highest_degree, dedication_type,
+        # monthly_salary and annual_salary
+        degree = self._codes(chunk['highest_degree'], self.degrees)
+        dedication = self._codes(chunk['dedication_type'], self.dedications)
+        cell = degree * self.counts.shape[1] + dedication
+
+        monthly = np.rint(chunk['monthly_salary'].to_numpy(dtype=float))
+        annual = np.rint(chunk['annual_salary'].to_numpy(dtype=float))
+
+        # Whole-peso float sums are exact below 2**53, far above any chunk total
+        size = self.counts.size
+        self.counts += np.bincount(cell, minlength=size).reshape(self.counts.shape)
+        self.total_monthly += np.bincount(cell, monthly, minlength=size).astype(np.int64).reshape(self.counts.shape)
+        self.total_annual += np.bincount(cell, annual, minlength=size).astype(np.int64).reshape(self.counts.shape)
+        self.monthly_sketch.update(monthly, series=dedication)
+        return self
+
+    def merge(self, other):
+        if self.degrees != other.degrees or self.dedications != other.dedications:
+            raise ValueError("Cannot merge accumulators with different categories")
+        self.counts += other.counts
+        self.total_monthly += other.total_monthly
+        self.total_annual += other.total_annual
+        self.monthly_sketch.merge(other.monthly_sketch)
+        return self
+
+    def _labeled(self, values, labels, used):
+        # The unrecognized bucket (last value) is only listed when used
+        labeled = dict(zip(labels, values[:-1]))
+        if used:
+            labeled[UNKNOWN_LABEL] = values[-1]
+        return labeled
+
+    def _shares(self, totals, labels):
+        grand_total = int(self.total_annual.sum())
+        totals = totals.tolist()
+        return {label: (total / grand_total if grand_total else 0.0)
+                for label, total in self._labeled(totals, labels, used=totals[-1] != 0).items()}
+
+    def payroll_stats(self):
+        count = int(self.counts.sum())
+        total_monthly = int(self.total_monthly.sum())
+        total_annual = int(self.total_annual.sum())
+        unknown_degree = bool(self.total_annual[-1].any())
+        unknown_dedication = bool(self.total_annual[:, -1].any())
+
+        return {
+            "ocasional": {
+                "count": count,
+                "total_monthly": total_monthly,
+                "total_annual": total_annual,
+                "average_monthly": total_monthly / count if count else 0.0,
+                "highest_degree_breakdown": self._shares(self.total_annual.sum(axis=1), self.degrees),
+                "dedication_breakdown": self._shares(self.total_annual.sum(axis=0), self.dedications),
+                # Exact annual totals per cell, so charts need not combine
+                # the marginal shares
+                "dedication_degree_totals": self._labeled(
+                    [self._labeled(column, self.degrees, used=unknown_degree)
+                     for column in self.total_annual.T.tolist()],
+                    self.dedications, used=unknown_dedication
+                ),
+                "counts_by_degree": dict(zip(self.degrees, self.counts.sum(axis=1).tolist())),
+                "counts_by_dedication": dict(zip(self.dedications, self.counts.sum(axis=0).tolist())),
+                "monthly_salary_quantiles": self.monthly_sketch.quantiles(self.quantiles),
+                "monthly_salary_quantiles_by_dedication": {
+                    dedication: self.monthly_sketch.quantiles(self.quantiles, series=i)
+                    for i, dedication in enumerate(self.dedications)
+                }
+            }
+        }
@@ -0,0 +1,173 @@
+import numpy as np
+from models.exact_payroll import HOURS_SCALE, to_scaled_hours
+from models.roster import encode_roster, DEFAULT_CATEDRA_HOURS, DEFAULT_WEEKLY_HOURS
+
+# One record per calculated row, 4 bytes each (about 4 MB per million
+# rows). The rule byte packs degree, experience bucket and dedication rule
+# in the low 7 bits (widths depend on the rate table, see _rule_layout)
+# and the degree fallback flag in bit 7. Hours are stored in hundredths
+# of an hour, the same precision as the exact payroll engine.
+PROVENANCE_DTYPE = np.dtype([
+    ('rate_table', np.uint8),
+    ('rules', np.uint8),
+    ('weekly_hours', np.uint16)
+])
+
+DEGREE_FALLBACK_FLAG = 1 << 7
+
+
+def _bits(n_values):
+    return max(int(n_values - 1).bit_length(), 1)
+
+
+def _rule_layout(hourly_rates, experience_bonus, dedication_types):
+    # Dedication rules are the calculator's own dedication types followed
+    # by "Hora Cátedra without declared hours" and "unknown dedication"
+    n_dedications = len(dedication_types)
+    layout = {
+        'degree_bits': _bits(len(hourly_rates)),
+        'experience_bits': _bits(len(experience_bonus)),
+        'dedication_bits': _bits(n_dedications + 2),
+        'catedra_default_hours_rule': n_dedications,
+        'unknown_dedication_rule': n_dedications + 1
+    }
+    if layout['degree_bits'] + layout['experience_bits'] + layout['dedication_bits'] > 7:
+        raise ValueError("Rate table has too many categories for the provenance rule byte")
+    return layout
+
+
+class CalculationProvenance:
+
+    def __init__(self):
+        self.rate_tables = []
+        self._rate_table_codes = {}
+        self._chunks = []
+        self._records = np.empty(0, dtype=PROVENANCE_DTYPE)
+
+    def _rate_table_code(self, calculator):
+        # Keyed on the table contents, so a calculator whose rates were
+        # changed without a new version label still gets its own snapshot
+        version = calculator.rate_table_version
+        key = (
+            version,
+            tuple(calculator.hourly_rates.items()),
+            tuple(calculator.dedication_types.items()),
+            tuple(calculator.experience_bonus.items()),
+            calculator.weeks_per_semester
+        )
+        if key not in self._rate_table_codes:
+            if len(self.rate_tables) > np.iinfo(PROVENANCE_DTYPE['rate_table']).max:
+                raise ValueError("Too many distinct rate tables for one provenance log")
+            self._rate_table_codes[key] = len(self.rate_tables)
+            self.rate_tables.append({
+                'version': version,
+                'hourly_rates': dict(calculator.hourly_rates),
+                'dedication_types': dict(calculator.dedication_types),
+                'experience_bonus': dict(calculator.experience_bonus),
+                'weeks_per_semester': calculator.weeks_per_semester,
+                'layout': _rule_layout(calculator.hourly_rates, calculator.experience_bonus,
+                                       calculator.dedication_types)
+            })
+        return self._rate_table_codes[key]
+
+    def record(self, calculator, roster):
+        # Call once per calculated chunk; rows are numbered in call order
+        codes = encode_roster(calculator, roster)
+        rate_table = self._rate_table_code(calculator)
+        layout = self.rate_tables[rate_table]['layout']
+        catedra = list(calculator.dedication_types).index('Hora Cátedra')
+
+        dedication_rule = codes['dedication_code'].astype(np.int16)
+        dedication_rule[(dedication_rule == catedra) & ~codes['hours_declared']] = layout['catedra_default_hours_rule']
+        dedication_rule[dedication_rule < 0] = layout['unknown_dedication_rule']
+
+        experience_shift = layout['degree_bits']
+        dedication_shift = experience_shift + layout['experience_bits']
+        records = np.empty(len(roster), dtype=PROVENANCE_DTYPE)
+        records['rate_table'] = rate_table
+        records['rules'] = (
+            codes['degree_code'].astype(np.uint8)
+            | codes['experience_code'].astype(np.uint8) << experience_shift
+            | dedication_rule.astype(np.uint8) << dedication_shift
+            | np.where(codes['degree_known'], 0, DEGREE_FALLBACK_FLAG).astype(np.uint8)
+        )
+        scaled_hours = to_scaled_hours(codes['weekly_hours'])
+        if ((scaled_hours < 0) | (scaled_hours > np.iinfo(PROVENANCE_DTYPE['weekly_hours']).max)).any():
+            raise ValueError("Weekly hours out of range for provenance records")
+        records['weekly_hours'] = scaled_hours
+        self._chunks.append(records)
+
+    @property
+    def records(self):
+        if self._chunks:
+            self._records = np.concatenate([self._records] + self._chunks)
+            self._chunks = []
+        return self._records
+
+    @property
+    def nbytes(self):
+        return self.records.nbytes
+
+    def __len__(self):
+        return len(self.records)
+
+    def explain(self, row_id):
+        record = self.records[row_id]
+        table = self.rate_tables[record['rate_table']]
+
+        layout = table['layout']
+        rules = int(record['rules'])
+        experience_shift = layout['degree_bits']
+        dedication_shift = experience_shift + layout['experience_bits']
+        degree = list(table['hourly_rates'])[rules & ((1 << layout['degree_bits']) - 1)]
+        experience_category = list(table['experience_bonus'])[
+            rules >> experience_shift & ((1 << layout['experience_bits']) - 1)
+        ]
+        dedications = list(table['dedication_types'])
+        rule = rules >> dedication_shift & ((1 << layout['dedication_bits']) - 1)
+        weekly_hours = int(record['weekly_hours']) / HOURS_SCALE
+
+        if rule == layout['catedra_default_hours_rule']:
+            dedication_type = 'Hora Cátedra'
+            dedication_rule = f"Hora Cátedra sin horas declaradas: se usan {DEFAULT_CATEDRA_HOURS} horas semanales"
+        elif rule == layout['unknown_dedication_rule']:
+            dedication_type = None
+            dedication_rule = f"Dedicación no reconocida: se usan {DEFAULT_WEEKLY_HOURS} horas semanales"
+        elif dedications[rule] == 'Hora Cátedra':
+            dedication_type = 'Hora Cátedra'
+            dedication_rule = f"Hora Cátedra con {weekly_hours:g} horas semanales declaradas"
+        else:
+            dedication_type = dedications[rule]
+            dedication_rule = f"{dedication_type}: {weekly_hours:g} horas semanales"
+
+        if rules & DEGREE_FALLBACK_FLAG:
+            degree_rule = f"Título no reconocido: se aplica la tarifa de {degree}"
+        else:
+            degree_rule = f"Tarifa por hora de {degree}"
+
+        # Same arithmetic as Acuerdo006Calculator.calculate_salary
+        hourly_rate = table['hourly_rates'][degree]
+        experience_bonus_rate = table['experience_bonus'][experience_category]
+        base_monthly = hourly_rate * weekly_hours * 4
+        experience_bonus_amount = base_monthly * experience_bonus_rate
+        semester_salary = hourly_rate * weekly_hours * table['weeks_per_semester']
+
+        return {
+            'row': row_id,
+            'rate_table_version': table['version'],
+            'highest_degree': degree,
+            'degree_rule': degree_rule,
+            'experience_category': experience_category,
+            'dedication_type': dedication_type,
+            'dedication_rule': dedication_rule,
+            'salary_breakdown': {
+                'hourly_rate': hourly_rate,
+                'weekly_hours': weekly_hours,
+                'base_monthly': base_monthly,
+                'experience_bonus_rate': experience_bonus_rate,
+                'experience_bonus_amount': experience_bonus_amount,
+                'monthly_salary': base_monthly + experience_bonus_amount,
+                'semester_salary': semester_salary,
+                'annual_salary': semester_salary * 2
+            }
+        }
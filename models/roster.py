@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+# Upper limits (inclusive) of the experience buckets, in the same order as
+# Acuerdo006Calculator.experience_bonus
+EXPERIENCE_LIMITS = np.array([2, 5, 10])
+
+DEFAULT_CATEDRA_HOURS = 8
+DEFAULT_WEEKLY_HOURS = 40
+
+
+def encode_roster(calculator, roster):
+    degrees = list(calculator.hourly_rates)
+    dedications = list(calculator.dedication_types)
+
+    degree_codes = pd.Categorical(roster['highest_degree'], categories=degrees).codes
+    degree_known = degree_codes >= 0
+    # Unknown degrees fall back to Pregrado, like calculate_salary
+    degree_codes = np.where(degree_known, degree_codes, degrees.index('Pregrado')).astype(np.int8)
+
+    dedication_codes = pd.Categorical(roster['dedication_type'], categories=dedications).codes.astype(np.int8)
+    fixed_hours = np.array(
+        [DEFAULT_WEEKLY_HOURS if h is None else h for h in calculator.dedication_types.values()] + [DEFAULT_WEEKLY_HOURS],
+        dtype=np.float64
+    )
+    weekly_hours = fixed_hours[dedication_codes]
+
+    catedra = dedication_codes == dedications.index('Hora Cátedra')
+    if 'weekly_hours' in roster:
+        declared = pd.to_numeric(roster['weekly_hours'], errors='coerce').to_numpy(dtype=np.float64)
+        hours_declared = ~np.isnan(declared)
+        declared = np.where(hours_declared, declared, DEFAULT_CATEDRA_HOURS)
+    else:
+        hours_declared = np.zeros(len(roster), dtype=bool)
+        declared = np.full(len(roster), DEFAULT_CATEDRA_HOURS)
+    # Declared hours keep their fractional part, like calculate_salary
+    weekly_hours = np.where(catedra, declared, weekly_hours)
+
+    experience_years = pd.to_numeric(roster['experience_years'], errors='coerce').fillna(0).to_numpy()
+    experience_codes = np.searchsorted(EXPERIENCE_LIMITS, experience_years, side='left').astype(np.int8)
+
+    return {
+        'degree_code': degree_codes,
+        'dedication_code': dedication_codes,
+        'weekly_hours': weekly_hours,
+        'experience_code': experience_codes,
+        'degree_known': degree_known,
+        'hours_declared': hours_declared & catedra
+    }
@@ -0,0 +1,95 @@
+import unicodedata
+import numpy as np
+import pandas as pd
+from models.acuerdo006 import Acuerdo006Calculator
+
+HORA_CATEDRA_MIN_HOURS = 1
+HORA_CATEDRA_MAX_HOURS = 19
+
+
+def normalize_label(label):
+    # "  maestria " and "MAESTRÍA" both become "maestria"
+    label = unicodedata.normalize('NFKD', str(label))
+    label = ''.join(c for c in label if not unicodedata.combining(c))
+    return ' '.join(label.split()).casefold()
+
+
+def _category_codes(values, categories):
+    # Normalization runs once per distinct label, not once per row
+    codes, uniques = pd.factorize(values)
+    lookup = {normalize_label(c): i for i, c in enumerate(categories)}
+    mapped = np.array([lookup.get(normalize_label(u), -1) for u in uniques] + [-1], dtype=np.int8)
+    # Missing values have code -1, which picks the trailing -1
+    return mapped[codes], codes < 0
+
+
+def _error_frame(index, checks):
+    # checks: (mask, column, code, message); one frame is built at the end
+    # from the rows that failed, ordered by row then by check
+    checks = [(np.flatnonzero(mask), column, code, message) for mask, column, code, message in checks]
+    positions = np.concatenate([rows for rows, *_ in checks])
+    check = np.repeat(np.arange(len(checks)), [len(rows) for rows, *_ in checks])
+    order = np.lexsort((check, positions))
+    columns, codes, messages = (np.array([c[i] for c in checks], dtype=object) for i in (1, 2, 3))
+    return pd.DataFrame({
+        # row is the roster's index label, so it lines up with normalized
+        'row': index[positions[order]],
+        'column': columns[check[order]],
+        'code': codes[check[order]],
+        'message': messages[check[order]]
+    })
+
+
+def validate_roster(roster, calculator=None):
+    calculator = calculator or Acuerdo006Calculator()
+    n = len(roster)
+    normalized = pd.DataFrame(index=roster.index)
+    everything = np.ones(n, dtype=bool)
+    checks = []
+
+    for column, categories in [('highest_degree', calculator.hourly_rates),
+                               ('dedication_type', calculator.dedication_types)]:
+        if column not in roster:
+            checks.append((everything, column, 'missing_column', f"Falta la columna {column}"))
+            normalized[column] = pd.Categorical.from_codes(np.full(n, -1), categories=list(categories))
+            continue
+        codes, missing = _category_codes(roster[column], list(categories))
+        checks.append((missing, column, 'missing', "Valor vacío"))
+        checks.append(((codes < 0) & ~missing, column, 'unknown_category', "Categoría no reconocida"))
+        normalized[column] = pd.Categorical.from_codes(codes, categories=list(categories))
+
+    if 'experience_years' in roster:
+        raw = roster['experience_years']
+        experience_years = pd.to_numeric(raw, errors='coerce').to_numpy(dtype=float)
+        not_numeric = np.isnan(experience_years)
+        missing = raw.isna().to_numpy() if not_numeric.any() else not_numeric
+        checks.append((missing, 'experience_years', 'missing', "Valor vacío"))
+        checks.append((not_numeric & ~missing, 'experience_years', 'not_numeric', "No es un número"))
+        checks.append((experience_years < 0, 'experience_years', 'out_of_range',
+                       "Los años de experiencia no pueden ser negativos"))
+    else:
+        experience_years = np.full(n, np.nan)
+        checks.append((everything, 'experience_years', 'missing_column', "Falta la columna experience_years"))
+    normalized['experience_years'] = experience_years
+
+    # Only Hora Cátedra uses the declared weekly hours
+    catedra = normalized['dedication_type'].cat.codes.to_numpy() == list(calculator.dedication_types).index('Hora Cátedra')
+    if 'weekly_hours' in roster:
+        weekly_hours = pd.to_numeric(roster['weekly_hours'], errors='coerce').to_numpy(dtype=float)
+    else:
+        weekly_hours = np.full(n, np.nan)
+    missing = catedra & np.isnan(weekly_hours)
+    out_of_range = catedra & ((weekly_hours < HORA_CATEDRA_MIN_HOURS) | (weekly_hours > HORA_CATEDRA_MAX_HOURS))
+    checks.append((missing, 'weekly_hours', 'missing', "Hora Cátedra requiere horas semanales"))
+    checks.append((out_of_range, 'weekly_hours', 'out_of_range',
+                   f"Las horas semanales deben estar entre {HORA_CATEDRA_MIN_HOURS} y {HORA_CATEDRA_MAX_HOURS}"))
+    normalized['weekly_hours'] = np.where(catedra, weekly_hours, np.nan)
+
+    for column in [c for c in roster.columns if c not in normalized.columns]:
+        normalized[column] = roster[column]
+
+    invalid = np.zeros(n, dtype=bool)
+    for mask, *_ in checks:
+        invalid |= mask
+    normalized['valid'] = ~invalid
+    return normalized, _error_frame(roster.index, checks)
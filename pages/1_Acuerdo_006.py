@@ -3,6 +3,7 @@ import pandas as pd
 import numpy as np
 from models.acuerdo006 import Acuerdo006Calculator
 from utils.visualizations import plot_salary_evolution
+from utils.statements import breakdown_table, projection_table
 
 st.set_page_config(
     page_title="Simulador de Salarios Profesores Ocasionales UPC",
@@ -15,6 +16,77 @@ st.title("Acuerdo 006 - Calculadora de Salarios para Profesores Ocasionales")
 # Initialize calculator
 acuerdo006_calculator = Acuerdo006Calculator()
 
+def _inputs_key(input_data):
+    return tuple(sorted(input_data.items()))
+
+
+def get_salary_results(input_data):
+    # Results and charts are kept in session state and only recomputed
+    # when the inputs they were computed from change
+    key = _inputs_key(input_data)
+    cached = st.session_state.get("acuerdo006_results")
+    if cached is None or cached["key"] != key:
+        results = acuerdo006_calculator.calculate_salary(input_data)
+        base_year = input_data["base_year"]
+        projection_years = input_data["projection_years"]
+        cached = {
+            "key": key,
+            "results": results,
+            "projection_figure": plot_salary_evolution(
+                results["salary_projection"],
+                title=f"Proyección de Evolución Salarial ({base_year} - {base_year + projection_years})"
+            )
+        }
+        st.session_state["acuerdo006_results"] = cached
+    return cached
+
+
+@st.fragment
+def render_career_evolution(input_data):
+    # Runs as a fragment: the checkbox and slider only rerun this section
+    st.subheader("Simulación de Evolución de Carrera")
+    simulate_evolution = st.checkbox(
+        "Simular evolución de carrera a lo largo del tiempo",
+        key="acuerdo006_simulate_evolution"
+    )
+    
+    if simulate_evolution:
+        evolution_years = st.slider(
+            "Años para simular la evolución de carrera",
+            min_value=5,
+            max_value=20,
+            value=10,
+            key="acuerdo006_evolution_years"
+        )
+        
+        key = (_inputs_key(input_data), evolution_years)
+        cached = st.session_state.get("acuerdo006_evolution")
+        if cached is None or cached["key"] != key:
+            cached = {
+                "key": key,
+                "results": acuerdo006_calculator.simulate_faculty_evolution(input_data, years=evolution_years)
+            }
+            st.session_state["acuerdo006_evolution"] = cached
+        evolution_results = cached["results"]
+        
+        # Display evolution chart
+        st.line_chart(
+            evolution_results[["monthly_salary", "annual_salary"]].set_index(evolution_results["year"])
+        )
+        
+        # Display evolution table
+        evolution_table = pd.DataFrame({
+            "Año": evolution_results["year"],
+            "Experiencia": evolution_results["experience_years"],
+            "Título más Alto": evolution_results["highest_degree"],
+            "Tarifa por Hora": [f"${s:,.0f}" for s in evolution_results["hourly_rate"]],
+            "Salario Mensual": [f"${s:,.0f}" for s in evolution_results["monthly_salary"]],
+            "Salario Anual": [f"${s:,.0f}" for s in evolution_results["annual_salary"]]
+        })
+        
+        st.dataframe(evolution_table, use_container_width=True)
+
+
 # Create two columns for input and output
 col1, col2 = st.columns([1, 1])
 
@@ -84,15 +156,17 @@ with col1:
     
     # Calculate button
     st.markdown("---")
-    calculate_button = st.button("Calcular Salario", type="primary")
+    if st.button("Calcular Salario", type="primary"):
+        st.session_state["acuerdo006_calculated"] = True
 
 # Output column
 with col2:
     st.header("Resultados del Cálculo")
     
-    if calculate_button:
+    if st.session_state.get("acuerdo006_calculated"):
         # Calculate salary
-        results = acuerdo006_calculator.calculate_salary(input_data)
+        calculation = get_salary_results(input_data)
+        results = calculation["results"]
         
         # Display hourly rate and weekly hours
         col_rate, col_hours = st.columns(2)
@@ -114,76 +188,21 @@ with col2:
         st.subheader("Desglose del Salario")
         breakdown = results["salary_breakdown"]
         
-        breakdown_df = pd.DataFrame({
-            "Componente": ["Tarifa por Hora", "Horas Semanales", "Base Mensual", "Tasa de Bonificación por Experiencia", 
-                         "Monto de Bonificación por Experiencia", "Total Mensual", "Total Semestral", "Total Anual"],
-            "Valor": [
-                f"${breakdown['hourly_rate']:,.0f} COP",
-                f"{breakdown['weekly_hours']} horas",
-                f"${breakdown['base_monthly']:,.0f} COP",
-                f"{breakdown['experience_bonus_rate']*100:.1f}%",
-                f"${breakdown['experience_bonus_amount']:,.0f} COP",
-                f"${breakdown['monthly_salary']:,.0f} COP",
-                f"${breakdown['semester_salary']:,.0f} COP",
-                f"${breakdown['annual_salary']:,.0f} COP"
-            ]
-        })
+        breakdown_df = breakdown_table(breakdown)
         
         st.table(breakdown_df)
         
         # Show salary projection
         st.subheader("Proyección Salarial")
         
-        # Create and display the plot
-        fig = plot_salary_evolution(
-            results["salary_projection"],
-            title=f"Proyección de Evolución Salarial ({base_year} - {base_year + projection_years})"
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        # Display the plot
+        st.plotly_chart(calculation["projection_figure"], use_container_width=True)
         
         # Show projection table
-        projection_table = pd.DataFrame({
-            "Año": [p["year"] for p in results["salary_projection"]],
-            "Tarifa por Hora": [f"${p['hourly_rate']:,.0f}" for p in results["salary_projection"]],
-            "Salario Mensual": [f"${p['monthly_salary']:,.0f}" for p in results["salary_projection"]],
-            "Salario Semestral": [f"${p['semester_salary']:,.0f}" for p in results["salary_projection"]],
-            "Salario Anual": [f"${p['annual_salary']:,.0f}" for p in results["salary_projection"]]
-        })
-        
-        st.dataframe(projection_table, use_container_width=True)
+        st.dataframe(projection_table(results["salary_projection"]), use_container_width=True)
         
         # Option to simulate career evolution
-        st.subheader("Simulación de Evolución de Carrera")
-        simulate_evolution = st.checkbox("Simular evolución de carrera a lo largo del tiempo")
-        
-        if simulate_evolution:
-            evolution_years = st.slider(
-                "Años para simular la evolución de carrera",
-                min_value=5,
-                max_value=20,
-                value=10
-            )
-            
-            # Simulate career evolution
-            evolution_results = acuerdo006_calculator.simulate_faculty_evolution(input_data, years=evolution_years)
-            
-            # Display evolution chart
-            st.line_chart(
-                evolution_results[["monthly_salary", "annual_salary"]].set_index(evolution_results["year"])
-            )
-            
-            # Display evolution table
-            evolution_table = pd.DataFrame({
-                "Año": evolution_results["year"],
-                "Experiencia": evolution_results["experience_years"],
-                "Título más Alto": evolution_results["highest_degree"],
-                "Tarifa por Hora": [f"${s:,.0f}" for s in evolution_results["hourly_rate"]],
-                "Salario Mensual": [f"${s:,.0f}" for s in evolution_results["monthly_salary"]],
-                "Salario Anual": [f"${s:,.0f}" for s in evolution_results["annual_salary"]]
-            })
-            
-            st.dataframe(evolution_table, use_container_width=True)
+        render_career_evolution(input_data)
     else:
         st.info("Ingrese la información del profesor y haga clic en 'Calcular Salario' para ver los resultados.")
 
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.acuerdo006 import Acuerdo006Calculator
+from models.backends import NUMBA_AVAILABLE, get_backend
+
+BACKENDS = [
+    "numpy",
+    pytest.param("numba", marks=pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba is not installed"))
+]
+
+
+def reference_evolution(calculator, faculty_data, years):
+    # Per-professor loop the vectorized backends replaced
+    results = []
+    current_data = faculty_data.copy()
+    for year in range(years):
+        current_data['experience_years'] = faculty_data['experience_years'] + year
+        if year == 2 and current_data['highest_degree'] == 'Pregrado':
+            current_data['highest_degree'] = 'Especialización'
+        elif year == 4 and current_data['highest_degree'] == 'Especialización':
+            current_data['highest_degree'] = 'Maestría'
+        current_data['base_year'] = faculty_data['base_year'] + year
+        calculation = calculator.calculate_salary(current_data)
+        results.append({
+            'year': faculty_data['base_year'] + year,
+            'experience_years': current_data['experience_years'],
+            'highest_degree': current_data['highest_degree'],
+            'dedication_type': current_data['dedication_type'],
+            'hourly_rate': calculation['hourly_rate'],
+            'monthly_salary': calculation['monthly_salary'],
+            'annual_salary': calculation['annual_salary']
+        })
+    return pd.DataFrame(results)
+
+
+@pytest.fixture
+def roster():
+    rng = np.random.default_rng(6)
+    n = 60
+    dedication = rng.choice(["Tiempo Completo", "Medio Tiempo", "Hora Cátedra"], n)
+    return pd.DataFrame({
+        'highest_degree': rng.choice(["Pregrado", "Especialización", "Maestría", "Doctorado"], n),
+        'dedication_type': dedication,
+        'experience_years': rng.integers(0, 20, n),
+        'weekly_hours': np.where(dedication == "Hora Cátedra", rng.choice([4, 7.5, 8, 12], n), np.nan),
+        'base_year': 2024
+    })
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_evolution_matches_reference_loop(backend, roster):
+    calculator = Acuerdo006Calculator(backend=backend)
+    evolution = calculator.simulate_roster_evolution(roster, years=8)
+
+    for row, faculty_data in enumerate(roster.to_dict('records')):
+        if faculty_data['dedication_type'] != "Hora Cátedra":
+            del faculty_data['weekly_hours']
+        expected = reference_evolution(calculator, faculty_data, 8)
+        actual = evolution[evolution['row'] == row].drop(columns='row').reset_index(drop=True)
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+    assert evolution['experience_years'].dtype == np.int64
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_projection_matches_calculate_salary(backend, roster):
+    calculator = Acuerdo006Calculator(backend=backend)
+    projection = calculator.project_roster(roster, base_year=2024, projection_years=5)
+
+    for row, faculty_data in enumerate(roster.to_dict('records')):
+        faculty_data['projection_years'] = 5
+        expected = pd.DataFrame(calculator.calculate_salary(faculty_data)['salary_projection'])
+        actual = projection[projection['row'] == row].drop(columns='row').reset_index(drop=True)
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_numpy_is_the_default_backend():
+    assert get_backend().name == "numpy"
+    assert Acuerdo006Calculator().backend.name == "numpy"
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.acuerdo006 import Acuerdo006Calculator
+from models.cohort_flow import CohortFlowProjector
+
+
+@pytest.fixture
+def roster():
+    return pd.DataFrame({
+        'highest_degree': ["Maestría", "Pregrado", "Doctorado", "Especialización", "Maestría"],
+        'dedication_type': ["Hora Cátedra", "Tiempo Completo", "Medio Tiempo", "Hora Cátedra", "Hora Cátedra"],
+        'experience_years': [1, 4, 12, 7, 0],
+        'weekly_hours': [7.5, np.nan, np.nan, 12, np.nan]
+    })
+
+
+def test_transition_rows_sum_to_survival():
+    projector = CohortFlowProjector(
+        attrition_rate=0.1,
+        dedication_transitions={"Hora Cátedra": {"Medio Tiempo": 0.2, "Tiempo Completo": 0.1}}
+    )
+    np.testing.assert_allclose(projector.transition_matrix.sum(axis=1), 0.9)
+
+
+def test_first_year_matches_roster_payroll(roster):
+    calculator = Acuerdo006Calculator()
+    projector = CohortFlowProjector(calculator)
+    population, hours = projector.population_from_roster(roster)
+    projection, _ = projector.project(population, years=3, initial_hours=hours)
+
+    # Undeclared hours are left out so calculate_salary applies its default
+    records = [{k: v for k, v in row.items() if not (k == 'weekly_hours' and np.isnan(v))}
+               for row in roster.to_dict('records')]
+    expected = sum(calculator.calculate_salary(row)['annual_salary'] for row in records)
+    assert projection['total_ocasional'].iloc[0] == pytest.approx(expected)
+
+
+def test_catedra_hours_are_carried(roster):
+    # Without attrition or moves, hours per state stay as declared
+    projector = CohortFlowProjector(attrition_rate=0.0, degree_upgrade_rates={})
+    population, hours = projector.population_from_roster(roster)
+    projection, _ = projector.project(population, years=5, initial_hours=hours, factors=np.ones(6))
+
+    per_hour = 2 * 16 * np.array([38000, 32000, 38000])
+    np.testing.assert_allclose(projection['total_hora_catedra'], per_hour @ [7.5, 12, 8])
+
+
+@pytest.mark.parametrize("kwargs", [
+    {'attrition_rate': 1.5},
+    {'degree_upgrade_rates': {"Pregrado": -0.1}},
+    {'dedication_transitions': {"Hora Cátedra": {"Medio Tiempo": 0.7, "Tiempo Completo": 0.5}}},
+    {'dedication_transitions': {"Hora Cátedra": {"Hora Cátedra": 0.1}}}
+])
+def test_invalid_rates_raise(kwargs):
+    with pytest.raises(ValueError):
+        CohortFlowProjector(**kwargs)
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.acuerdo006 import Acuerdo006Calculator
+from models.contract_calendar import AcademicCalendar, ProratedPayrollEngine
+
+
+@pytest.fixture
+def calendar():
+    return AcademicCalendar(pd.DataFrame({
+        'start': ["2024-02-05", "2024-03-25", "2024-08-05"],
+        'end': ["2024-06-07", "2024-03-29", "2024-11-29"],
+        'type': ["term", "holiday", " Term "]
+    }))
+
+
+def contract(start, end, **fields):
+    return pd.DataFrame([{
+        'highest_degree': "Maestría", 'dedication_type': "Tiempo Completo", 'experience_years': 4,
+        'contract_start': start, 'contract_end': end, **fields
+    }])
+
+
+def test_teaching_days_skip_weekends_and_holidays(calendar):
+    # Two full weeks, the second one is Holy Week
+    assert calendar.teaching_days(np.array(["2024-03-18"]), np.array(["2024-03-31"])).tolist() == [5]
+    # Outside the calendar nothing counts
+    assert calendar.teaching_days(np.array(["2025-01-01"]), np.array(["2025-02-01"])).tolist() == [0]
+
+
+def test_four_week_month_pays_monthly_salary(calendar):
+    engine = ProratedPayrollEngine(calendar)
+    monthly = engine.monthly_payroll(contract("2024-04-01", "2024-04-26"))
+    expected = Acuerdo006Calculator().calculate_salary(
+        {'highest_degree': "Maestría", 'dedication_type': "Tiempo Completo", 'experience_years': 4}
+    )['monthly_salary']
+    assert monthly['teaching_weeks'].tolist() == [4.0]
+    assert monthly['payable'].iloc[0] == pytest.approx(expected)
+
+
+def test_contract_totals_split_by_month(calendar):
+    engine = ProratedPayrollEngine(calendar)
+    roster = contract("2024-05-20", "2024-06-30", dedication_type="Hora Cátedra", weekly_hours=7.5)
+    monthly = engine.monthly_payroll(roster)
+    assert monthly['teaching_days'].tolist() == [10, 5]
+    totals = engine.contract_totals(roster)
+    assert totals['teaching_weeks'].iloc[0] == 3
+    assert totals['payable'].iloc[0] == pytest.approx(38000 * 7.5 * 3 * 1.05)
+
+
+@pytest.mark.parametrize("start, end", [(None, "2024-06-30"), ("2024-05-20", "not a date")])
+def test_invalid_contract_dates_raise(calendar, start, end):
+    with pytest.raises(ValueError, match="contract_"):
+        ProratedPayrollEngine(calendar).monthly_payroll(contract(start, end))
+
+
+def test_unknown_period_type_raises():
+    with pytest.raises(ValueError, match="holidays"):
+        AcademicCalendar(pd.DataFrame({
+            'start': ["2024-02-05", "2024-03-25"], 'end': ["2024-06-07", "2024-03-29"], 'type': ["term", "holidays"]
+        }))
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.acuerdo006 import Acuerdo006Calculator
+from models.exact_payroll import BASIS_POINTS, ExactPayrollCalculator, round_half_up, to_scaled_hours
+
+
+@pytest.fixture
+def roster():
+    rng = np.random.default_rng(26)
+    n = 500
+    dedication = rng.choice(["Tiempo Completo", "Medio Tiempo", "Hora Cátedra"], n)
+    return pd.DataFrame({
+        'highest_degree': rng.choice(["Pregrado", "Especialización", "Maestría", "Doctorado"], n),
+        'dedication_type': dedication,
+        'experience_years': rng.integers(0, 20, n),
+        'weekly_hours': np.where(dedication == "Hora Cátedra", rng.choice([4, 7.5, 8, 12.25], n), np.nan)
+    })
+
+
+def test_round_half_up_at_half_boundaries():
+    assert round_half_up([5, 15, 25, 14, 16], 10).tolist() == [1, 2, 3, 1, 2]
+    assert round_half_up(np.array([50, 149, 150]), 100).tolist() == [1, 1, 2]
+
+
+def test_to_scaled_hours():
+    assert to_scaled_hours([8, 7.5, 12.25]).tolist() == [800, 750, 1225]
+    with pytest.raises(ValueError):
+        to_scaled_hours([7.333])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 499, None])
+def test_totals_do_not_depend_on_chunking(roster, chunk_size):
+    engine = ExactPayrollCalculator()
+    assert engine.totals(roster, chunk_size=chunk_size) == engine.totals(roster)
+
+
+def test_calculate_matches_calculate_salary(roster):
+    calculator = Acuerdo006Calculator()
+    result = ExactPayrollCalculator(calculator).calculate(roster)
+
+    for row, faculty_data in zip(result.itertuples(), roster.to_dict('records')):
+        expected = calculator.calculate_salary(faculty_data)
+        assert row.monthly_salary == pytest.approx(expected['monthly_salary'], abs=1)
+        # Whole-peso amounts without a bonus are exact in both paths
+        assert row.annual_salary == expected['annual_salary']
+        assert row.base_monthly == expected['salary_breakdown']['base_monthly']
+
+
+def test_project_rounds_each_year_from_previous_rate(roster):
+    engine = ExactPayrollCalculator()
+    projection = engine.project(roster.head(3), base_year=2024, projection_years=4)
+    rates = projection.pivot(index='year', columns='row', values='hourly_rate').to_numpy()
+
+    for year in range(1, 5):
+        expected = np.floor(rates[year - 1] * (BASIS_POINTS + 400) / BASIS_POINTS + 0.5)
+        assert rates[year].tolist() == expected.tolist()
+    assert projection['annual_salary'].dtype == np.int64
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.acuerdo006 import Acuerdo006Calculator
+from models.indexation import IndexationSeries
+
+
+@pytest.fixture
+def series():
+    years = range(2022, 2029)
+    return IndexationSeries(pd.DataFrame({
+        'base': [0.10, 0.09, 0.05, 0.04, 0.04, 0.03, 0.03],
+        'optimistic': [0.10, 0.09, 0.03, 0.02, 0.02, 0.02, 0.02]
+    }, index=years))
+
+
+def test_factors_start_at_base_year(series):
+    factors = series.factors(2024, 3)
+    assert factors.shape == (2, 4)
+    np.testing.assert_allclose(factors[:, 0], 1)
+    np.testing.assert_allclose(factors[0], np.cumprod([1, 1.04, 1.04, 1.03]))
+    np.testing.assert_allclose(series.factors(2023, 1, ['optimistic'])[0], [1, 1.03])
+
+
+@pytest.mark.parametrize("base_year, years", [(2021, 2), (2026, 3)])
+def test_factors_outside_series_raise(series, base_year, years):
+    with pytest.raises(ValueError, match="covers 2022-2028"):
+        series.factors(base_year, years)
+
+
+def test_non_consecutive_years_raise():
+    with pytest.raises(ValueError):
+        IndexationSeries(pd.DataFrame({'base': [0.04, 0.04]}, index=[2024, 2026]))
+
+
+def test_calculator_defaults_to_base_path(series):
+    calculator = Acuerdo006Calculator(indexation=series)
+    np.testing.assert_allclose(calculator.indexation_factors(2024, 2), series.factors(2024, 2, ['base'])[0])
+    np.testing.assert_allclose(calculator.indexation_factors(2024, 2, 'optimistic'), [1, 1.02, 1.0404])
+
+
+def test_single_path_is_used_and_ambiguous_paths_raise():
+    single = IndexationSeries.constant(0.05, 2024, 2030, path='ipc')
+    np.testing.assert_allclose(Acuerdo006Calculator(indexation=single).indexation_factors(2024, 1), [1, 1.05])
+
+    ambiguous = IndexationSeries(pd.DataFrame({'a': [0.01] * 3, 'b': [0.02] * 3}, index=range(2024, 2027)))
+    with pytest.raises(ValueError, match="indexation_path"):
+        Acuerdo006Calculator(indexation=ambiguous).indexation_factors(2024, 1)
+
+
+def test_calculate_salary_projection_uses_series_and_plain_floats(series):
+    calculator = Acuerdo006Calculator(indexation=series)
+    result = calculator.calculate_salary({
+        'highest_degree': "Maestría", 'dedication_type': "Medio Tiempo", 'experience_years': 4,
+        'base_year': 2024, 'projection_years': 2
+    })
+    projection = result['salary_projection']
+    assert [p['hourly_rate'] for p in projection] == pytest.approx([38000, 39520, 41100.8])
+    assert all(type(p[key]) is float for p in projection for key in p if key != 'year')
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.payroll_stats import UNKNOWN_LABEL, PayrollStatsAccumulator, QuantileSketch
+from utils.visualizations import plot_ocasional_payroll_breakdown
+
+
+@pytest.fixture
+def payroll():
+    rng = np.random.default_rng(33)
+    n = 20000
+    monthly = np.rint(rng.lognormal(15, 0.5, n))
+    return pd.DataFrame({
+        'highest_degree': rng.choice(["Pregrado", "Especialización", "Maestría", "Doctorado", "Licenciatura"], n),
+        'dedication_type': rng.choice(["Tiempo Completo", "Medio Tiempo", "Hora Cátedra", "Contrato"], n),
+        'monthly_salary': monthly,
+        'annual_salary': monthly * 12
+    })
+
+
+def test_merged_chunks_equal_single_pass(payroll):
+    whole = PayrollStatsAccumulator().update(payroll).payroll_stats()
+    merged = PayrollStatsAccumulator()
+    for start in range(0, len(payroll), 3000):
+        merged.merge(PayrollStatsAccumulator().update(payroll.iloc[start:start + 3000]))
+    assert merged.payroll_stats() == whole
+    assert whole['ocasional']['total_annual'] == int(payroll['annual_salary'].sum())
+
+
+def test_sketch_quantiles_within_relative_accuracy(payroll):
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    sketch.update(payroll['monthly_salary'])
+    quantiles = (0.1, 0.5, 0.9, 0.99)
+    estimated = sketch.quantiles(quantiles)
+    for q in quantiles:
+        exact = np.quantile(payroll['monthly_salary'], q, method='lower')
+        assert estimated[q] == pytest.approx(exact, rel=0.011)
+
+
+def test_breakdowns_add_up_with_unknown_labels(payroll):
+    stats = PayrollStatsAccumulator().update(payroll).payroll_stats()['ocasional']
+    assert sum(stats['dedication_breakdown'].values()) == pytest.approx(1)
+    assert sum(stats['highest_degree_breakdown'].values()) == pytest.approx(1)
+    assert UNKNOWN_LABEL in stats['dedication_degree_totals']
+    cells = stats['dedication_degree_totals']
+    assert sum(sum(degrees.values()) for degrees in cells.values()) == stats['total_annual']
+
+
+def test_unknown_bucket_omitted_when_empty(payroll):
+    known = payroll[payroll['dedication_type'] != "Contrato"]
+    stats = PayrollStatsAccumulator().update(known).payroll_stats()['ocasional']
+    assert UNKNOWN_LABEL not in stats['dedication_breakdown']
+    assert UNKNOWN_LABEL not in stats['dedication_degree_totals']
+    assert UNKNOWN_LABEL in stats['dedication_degree_totals']['Medio Tiempo']
+
+
+def test_sunburst_children_sum_to_parents(payroll):
+    stats = PayrollStatsAccumulator().update(payroll).payroll_stats()
+    trace = plot_ocasional_payroll_breakdown({'payroll_stats': stats}).data[0]
+    values = dict(zip(trace.ids, trace.values))
+    children = {}
+    for node, parent in zip(trace.ids, trace.parents):
+        if parent:
+            children[parent] = children.get(parent, 0) + values[node]
+    assert trace.branchvalues == "total"
+    for parent, total in children.items():
+        assert values[parent] == total
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.acuerdo006 import Acuerdo006Calculator
+from models.provenance import DEGREE_FALLBACK_FLAG, PROVENANCE_DTYPE, CalculationProvenance
+
+
+@pytest.fixture
+def roster():
+    return pd.DataFrame({
+        'highest_degree': ["Maestría", "Doctorado", "Licenciatura", "Especialización", "Pregrado"],
+        'dedication_type': ["Hora Cátedra", "Tiempo Completo", "Hora Cátedra", "Contrato", "Medio Tiempo"],
+        'experience_years': [1, 7, 12, 4, 30],
+        'weekly_hours': [7.5, np.nan, np.nan, np.nan, np.nan]
+    })
+
+
+def test_records_are_four_bytes():
+    assert PROVENANCE_DTYPE.itemsize == 4
+
+
+def test_explain_matches_calculate_salary(roster):
+    calculator = Acuerdo006Calculator()
+    provenance = CalculationProvenance()
+    provenance.record(calculator, roster.iloc[:2])
+    provenance.record(calculator, roster.iloc[2:])
+
+    assert len(provenance) == len(roster)
+    for row, faculty_data in enumerate(roster.to_dict('records')):
+        if np.isnan(faculty_data['weekly_hours']):
+            del faculty_data['weekly_hours']
+        expected = calculator.calculate_salary(faculty_data)['salary_breakdown']
+        explained = provenance.explain(row)['salary_breakdown']
+        for key, value in expected.items():
+            assert explained[key] == pytest.approx(value), (row, key)
+
+
+def test_rules_are_decoded(roster):
+    provenance = CalculationProvenance()
+    provenance.record(Acuerdo006Calculator(), roster)
+
+    assert provenance.explain(0)['dedication_rule'] == "Hora Cátedra con 7.5 horas semanales declaradas"
+    assert provenance.explain(1)['experience_category'] == "6-10 años"
+    fallback = provenance.explain(2)
+    assert fallback['highest_degree'] == "Pregrado"
+    assert fallback['degree_rule'].startswith("Título no reconocido")
+    assert "sin horas declaradas" in fallback['dedication_rule']
+    assert provenance.explain(3)['dedication_type'] is None
+    assert provenance.records['rules'][2] & DEGREE_FALLBACK_FLAG
+    assert not provenance.records['rules'][0] & DEGREE_FALLBACK_FLAG
+
+
+def test_changed_rates_get_their_own_snapshot(roster):
+    provenance = CalculationProvenance()
+    provenance.record(Acuerdo006Calculator(), roster.iloc[:1])
+    changed = Acuerdo006Calculator()
+    changed.hourly_rates["Maestría"] = 40000
+    provenance.record(changed, roster.iloc[:1])
+
+    assert len(provenance.rate_tables) == 2
+    assert provenance.explain(0)['salary_breakdown']['hourly_rate'] == 38000
+    assert provenance.explain(1)['salary_breakdown']['hourly_rate'] == 40000
+
+
+def test_too_many_categories_raise(roster):
+    calculator = Acuerdo006Calculator()
+    calculator.hourly_rates.update({f"Grado {i}": 50000 + i for i in range(20)})
+    with pytest.raises(ValueError):
+        CalculationProvenance().record(calculator, roster)
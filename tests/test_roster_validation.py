@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+from models.roster_validation import normalize_label, validate_roster
+
+
+def errors_by_row(errors):
+    return {row: sorted(group['code']) for row, group in errors.groupby('row')}
+
+
+def test_normalize_label_ignores_accents_case_and_spaces():
+    assert normalize_label("  MAESTRIA ") == normalize_label("Maestría") == "maestria"
+    assert normalize_label("Hora  cátedra") == "hora catedra"
+
+
+def test_labels_are_normalized_to_categories():
+    roster = pd.DataFrame({
+        'highest_degree': ["maestria", " DOCTORADO", "Especializacion"],
+        'dedication_type': ["hora catedra", "TIEMPO COMPLETO", "medio tiempo "],
+        'experience_years': [1, 2, 3],
+        'weekly_hours': [7.5, np.nan, np.nan]
+    })
+    normalized, errors = validate_roster(roster)
+    assert errors.empty
+    assert normalized['highest_degree'].tolist() == ["Maestría", "Doctorado", "Especialización"]
+    assert normalized['dedication_type'].tolist() == ["Hora Cátedra", "Tiempo Completo", "Medio Tiempo"]
+    assert normalized['valid'].all()
+
+
+def test_errors_report_index_labels():
+    roster = pd.DataFrame({
+        'highest_degree': ["Maestría", "Licenciatura", None, "Doctorado"],
+        'dedication_type': ["Hora Cátedra", "Tiempo Completo", "Medio Tiempo", "Hora Cátedra"],
+        'experience_years': [-1, 2, "diez", 4],
+        'weekly_hours': [25, np.nan, np.nan, np.nan]
+    }, index=["p1", "p2", "p3", "p4"])
+    normalized, errors = validate_roster(roster)
+    assert errors_by_row(errors) == {
+        "p1": ['out_of_range', 'out_of_range'],
+        "p2": ['unknown_category'],
+        "p3": ['missing', 'not_numeric'],
+        "p4": ['missing']
+    }
+    assert normalized['valid'].tolist() == [False, False, False, False]
+    assert normalized.index.tolist() == roster.index.tolist()
+
+
+def test_hora_catedra_hours_range():
+    roster = pd.DataFrame({
+        'highest_degree': "Maestría",
+        'dedication_type': "Hora Cátedra",
+        'experience_years': 1,
+        'weekly_hours': [0.5, 1, 7.5, 19, 19.5]
+    })
+    normalized, errors = validate_roster(roster)
+    assert normalized['valid'].tolist() == [False, True, True, True, False]
+    assert set(errors['code']) == {'out_of_range'}
+
+
+def test_missing_columns():
+    normalized, errors = validate_roster(pd.DataFrame({'highest_degree': ["Maestría", "Doctorado"]}))
+    missing = errors[errors['code'] == 'missing_column']
+    assert sorted(set(missing['column'])) == ['dedication_type', 'experience_years']
+    assert len(missing) == 4
+    assert not normalized['valid'].any()
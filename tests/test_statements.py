@@ -0,0 +1,81 @@
+import os
+import re
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.acuerdo006 import Acuerdo006Calculator
+from utils.statements import _statement_payloads, generate_statements, statement_filenames
+
+
+@pytest.fixture
+def roster():
+    return pd.DataFrame({
+        'professor_id': ["a/1", "a_1", "b", "a_1"],
+        'name': ["Ana", "Luis", "Marta", "Pedro"],
+        'highest_degree': ["Maestría", "Doctorado", "Pregrado", "Especialización"],
+        'dedication_type': ["Hora Cátedra", "Tiempo Completo", "Medio Tiempo", "Hora Cátedra"],
+        'experience_years': [1, 7, 12, 4],
+        'weekly_hours': [7.5, np.nan, np.nan, 12]
+    })
+
+
+def test_filenames_are_unique():
+    assert statement_filenames(['a', 'a_3', 'a_3_3', 'a']) == ['a.html', 'a_3.html', 'a_3_3.html', 'a_1.html']
+    ids = ['a/1', 'a_1', 'a_1', 'a_1_1', 'a 1', 'x'] + ['a'] * 50
+    filenames = statement_filenames(ids)
+    assert len(set(filenames)) == len(ids)
+    assert filenames[0] == 'a_1.html'
+
+
+def test_payloads_match_calculate_salary(roster):
+    calculator = Acuerdo006Calculator()
+    payloads = list(_statement_payloads(calculator, roster, 2024, 3))
+
+    for payload, faculty_data in zip(payloads, roster.to_dict('records')):
+        faculty_data['projection_years'] = 3
+        expected = calculator.calculate_salary(faculty_data)
+        assert payload['salary_breakdown'] == expected['salary_breakdown']
+        assert payload['salary_projection'] == pytest.approx(expected['salary_projection'])
+
+
+def without_div_ids(content):
+    # plotly gives every chart a random div id
+    return re.sub(rb'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', b'', content)
+
+
+def test_zip_and_directory_output(roster, tmp_path):
+    archive = str(tmp_path / "certificados.zip")
+    directory = str(tmp_path / "certificados")
+    assert generate_statements(roster, archive, processes=1, projection_years=2) == len(roster)
+    assert generate_statements(roster, directory, processes=1, projection_years=2) == len(roster)
+
+    expected = {'plotly.min.js', 'a_1.html', 'a_1_1.html', 'b.html', 'a_1_2.html'}
+    with zipfile.ZipFile(archive) as z:
+        assert set(z.namelist()) == expected
+        zipped = {name: z.read(name) for name in expected}
+    assert set(os.listdir(directory)) == expected
+    for name, content in zipped.items():
+        with open(os.path.join(directory, name), "rb") as f:
+            assert without_div_ids(f.read()) == without_div_ids(content)
+
+    statement = zipped['a_1.html'].decode("utf-8")
+    assert '<script src="plotly.min.js"></script>' in statement
+    assert "7.5 horas" in statement
+    # Shared mode keeps the script out of every statement
+    assert len(statement) < 100000
+
+
+def test_inline_output_is_self_contained(roster, tmp_path):
+    output = str(tmp_path / "inline")
+    generate_statements(roster.head(1), output, processes=1, projection_years=1, plotly_js="inline")
+    assert os.listdir(output) == ['a_1.html']
+    with open(os.path.join(output, 'a_1.html'), encoding="utf-8") as f:
+        assert not re.search(r'<script src=', f.read())
+
+
+def test_unknown_plotly_mode_raises(roster, tmp_path):
+    with pytest.raises(ValueError):
+        generate_statements(roster, str(tmp_path / "x"), plotly_js="cdn")
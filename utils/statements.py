@@ -0,0 +1,202 @@
+import html
+import os
+import re
+import zipfile
+import multiprocessing
+
+import pandas as pd
+from plotly.offline import get_plotlyjs
+
+from models.acuerdo006 import Acuerdo006Calculator
+from utils.visualizations import plot_salary_evolution
+
+STATEMENT_CSS = """
+body { font-family: sans-serif; color: #262730; margin: 2rem auto; max-width: 960px; }
+h1 { color: #0066cc; font-size: 1.6rem; }
+table { border-collapse: collapse; width: 100%; margin-bottom: 1.5rem; }
+th, td { border: 1px solid #d0d3da; padding: 0.35rem 0.6rem; text-align: left; }
+th { background: #f0f2f6; }
+footer { color: #6c6f76; font-size: 0.8rem; margin-top: 2rem; }
+"""
+
+def breakdown_table(breakdown):
+    return pd.DataFrame({
+        "Componente": ["Tarifa por Hora", "Horas Semanales", "Base Mensual", "Tasa de Bonificación por Experiencia",
+                       "Monto de Bonificación por Experiencia", "Total Mensual", "Total Semestral", "Total Anual"],
+        "Valor": [
+            f"${breakdown['hourly_rate']:,.0f} COP",
+            f"{breakdown['weekly_hours']:g} horas",
+            f"${breakdown['base_monthly']:,.0f} COP",
+            f"{breakdown['experience_bonus_rate']*100:.1f}%",
+            f"${breakdown['experience_bonus_amount']:,.0f} COP",
+            f"${breakdown['monthly_salary']:,.0f} COP",
+            f"${breakdown['semester_salary']:,.0f} COP",
+            f"${breakdown['annual_salary']:,.0f} COP"
+        ]
+    })
+
+
+def projection_table(salary_projection):
+    return pd.DataFrame({
+        "Año": [p["year"] for p in salary_projection],
+        "Tarifa por Hora": [f"${p['hourly_rate']:,.0f}" for p in salary_projection],
+        "Salario Mensual": [f"${p['monthly_salary']:,.0f}" for p in salary_projection],
+        "Salario Semestral": [f"${p['semester_salary']:,.0f}" for p in salary_projection],
+        "Salario Anual": [f"${p['annual_salary']:,.0f}" for p in salary_projection]
+    })
+
+
+def _statement_payloads(calculator, roster, base_year, projection_years):
+    # All amounts are computed here, in the caller's thread, in one
+    # vectorized pass; the returned generator only slices the arrays and
+    # workers only format and render
+    breakdown = calculator.roster_breakdown(roster)
+    breakdown_columns = list(breakdown.columns)
+    breakdown_values = breakdown.to_numpy()
+
+    projection = calculator.project_roster(roster, base_year=base_year, projection_years=projection_years)
+    projection_columns = ['year', 'hourly_rate', 'monthly_salary', 'semester_salary', 'annual_salary']
+    projection_values = projection[projection_columns].to_numpy().reshape(projection_years + 1, len(roster), -1)
+
+    names = roster['name'].astype(str).tolist() if 'name' in roster else [None] * len(roster)
+    ids = roster['professor_id'].astype(str).tolist() if 'professor_id' in roster else [str(i) for i in range(len(roster))]
+    filenames = statement_filenames(ids)
+    degrees = roster['highest_degree'].tolist()
+    dedications = roster['dedication_type'].tolist()
+
+    def payload(i):
+        return {
+            'professor_id': ids[i],
+            'filename': filenames[i],
+            'name': names[i],
+            'highest_degree': degrees[i],
+            'dedication_type': dedications[i],
+            'salary_breakdown': dict(zip(breakdown_columns, breakdown_values[i].tolist())),
+            'salary_projection': [
+                {**dict(zip(projection_columns, values)), 'year': int(values[0])}
+                for values in projection_values[:, i]
+            ]
+        }
+
+    return (payload(i) for i in range(len(roster)))
+
+
+def statement_head(plotly_js="shared"):
+    # Identical for every statement, so it is built and encoded once
+    if plotly_js == "inline":
+        script = f"<script type=\"text/javascript\">{get_plotlyjs()}</script>"
+    else:
+        script = "<script src=\"plotly.min.js\"></script>"
+    return (
+        "<!DOCTYPE html><html lang=\"es\"><head><meta charset=\"utf-8\">"
+        f"<style>{STATEMENT_CSS}</style>{script}"
+    )
+
+
+def statement_filename(professor_id):
+    return re.sub(r'[^\w.-]+', '_', professor_id) + ".html"
+
+
+def statement_filenames(professor_ids):
+    # Different ids can sanitize to the same name ('a/1' and 'a_1'), and
+    # ids may repeat; later rows get a counter appended, kept per name so
+    # every attempt tries a new candidate
+    used = set()
+    next_suffix = {}
+    filenames = []
+    for professor_id in professor_ids:
+        filename = base = statement_filename(professor_id)
+        while filename in used:
+            next_suffix[base] = next_suffix.get(base, 0) + 1
+            filename = statement_filename(f"{professor_id}_{next_suffix[base]}")
+        used.add(filename)
+        filenames.append(filename)
+    return filenames
+
+
+def render_statement(payload, base_year, projection_years):
+    title = f"Certificado Salarial - {payload['name'] or payload['professor_id']}"
+    chart = plot_salary_evolution(
+        payload['salary_projection'],
+        title=f"Proyección de Evolución Salarial ({base_year} - {base_year + projection_years})"
+    ).to_html(full_html=False, include_plotlyjs=False)
+
+    # Everything after statement_head(); workers only send this part back
+    return "".join([
+        f"<title>{html.escape(title)}</title></head>",
+        "<body>",
+        f"<h1>{html.escape(title)}</h1>",
+        f"<p>Título más alto: {html.escape(str(payload['highest_degree']))} &middot; ",
+        f"Dedicación: {html.escape(str(payload['dedication_type']))}</p>",
+        "<h2>Desglose del Salario</h2>",
+        breakdown_table(payload['salary_breakdown']).to_html(index=False, border=0),
+        "<h2>Proyección Salarial</h2>",
+        chart,
+        projection_table(payload['salary_projection']).to_html(index=False, border=0),
+        "<footer>Calculado según el Acuerdo 006 de 2018 - Simulador de Salarios Docentes UPC</footer>",
+        "</body></html>"
+    ])
+
+
+def _render_chunk(args):
+    payloads, base_year, projection_years = args
+    return [
+        (p['filename'], render_statement(p, base_year, projection_years))
+        for p in payloads
+    ]
+
+
+def _chunks(payloads, chunk_size):
+    chunk = []
+    for payload in payloads:
+        chunk.append(payload)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def generate_statements(roster, output, calculator=None, base_year=2024, projection_years=5,
+                        processes=None, chunk_size=50, plotly_js="shared"):
+    # output ending in .zip writes an archive, anything else a directory.
+    # plotly_js="shared" writes plotly.min.js (~4.8 MB) once next to the
+    # statements; plotly_js="inline" makes every statement self-contained
+    # at the cost of a copy of the script in each file.
+    archive_output = output.endswith(".zip")
+    if plotly_js not in ("inline", "shared"):
+        raise ValueError(f"Unknown plotly_js mode: {plotly_js}")
+    calculator = calculator or Acuerdo006Calculator()
+    payloads = _statement_payloads(calculator, roster, base_year, projection_years)
+    tasks = ((chunk, base_year, projection_years) for chunk in _chunks(payloads, chunk_size))
+
+    if archive_output:
+        archive = zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED)
+        write = archive.writestr
+    else:
+        archive = None
+        os.makedirs(output, exist_ok=True)
+
+        def write(name, content):
+            with open(os.path.join(output, name), "wb") as f:
+                f.write(content)
+
+    written = 0
+    try:
+        if plotly_js == "shared":
+            write("plotly.min.js", get_plotlyjs().encode("utf-8"))
+
+        head = statement_head(plotly_js).encode("utf-8")
+        # Spawned workers do not inherit the parent's threads (e.g. numba's
+        # threading layer), which can deadlock forked children
+        with multiprocessing.get_context("spawn").Pool(processes) as pool:
+            # Statements are written as soon as each chunk is rendered
+            for rendered in pool.imap_unordered(_render_chunk, tasks):
+                for name, body in rendered:
+                    write(name, head + body.encode("utf-8"))
+                written += len(rendered)
+    finally:
+        if archive is not None:
+            archive.close()
+
+    return written
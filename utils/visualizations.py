@@ -208,30 +208,51 @@ def plot_ocasional_payroll_breakdown(ocasional_data):
     # Create data for the sunburst chart
     sunburst_data = [
         # Level 1: Total Payroll
-        {"id": "Total Occasional", "parent": "", "value": stats["ocasional"]["total_annual"]},
-        
-        # Level 2: Dedication Types
-        {"id": "Tiempo Completo", "parent": "Total Occasional", 
-         "value": stats["ocasional"]["total_annual"] * 0.6},  # Approximate
-        {"id": "Medio Tiempo", "parent": "Total Occasional", 
-         "value": stats["ocasional"]["total_annual"] * 0.25},  # Approximate
-        {"id": "Hora Cátedra", "parent": "Total Occasional", 
-         "value": stats["ocasional"]["total_annual"] * 0.15}   # Approximate
+        {"id": "Total Occasional", "parent": "", "value": stats["ocasional"]["total_annual"]}
     ]
     
-    # Add degree breakdown for each dedication type if available
-    if "highest_degree_breakdown" in stats["ocasional"]:
-        degree_breakdown = stats["ocasional"]["highest_degree_breakdown"]
-        for degree, percentage in degree_breakdown.items():
-            for dedication in ["Tiempo Completo", "Medio Tiempo", "Hora Cátedra"]:
-                # Use estimated percentages for different dedication types
-                ded_percentage = 0.6 if dedication == "Tiempo Completo" else (0.25 if dedication == "Medio Tiempo" else 0.15)
-                value = stats["ocasional"]["total_annual"] * ded_percentage * percentage
+    if "dedication_degree_totals" in stats["ocasional"]:
+        # Exact totals per dedication and degree; every parent is the sum
+        # of its children
+        for dedication, degree_totals in stats["ocasional"]["dedication_degree_totals"].items():
+            sunburst_data.append({
+                "id": dedication,
+                "parent": "Total Occasional",
+                "value": sum(degree_totals.values())
+            })
+            for degree, total in degree_totals.items():
                 sunburst_data.append({
                     "id": f"{dedication} - {degree}",
                     "parent": dedication,
-                    "value": value
+                    "value": total
                 })
+        branchvalues = "total"
+    else:
+        dedication_breakdown = stats["ocasional"].get(
+            "dedication_breakdown",
+            {"Tiempo Completo": 0.6, "Medio Tiempo": 0.25, "Hora Cátedra": 0.15}  # Approximate
+        )
+        
+        # Level 2: Dedication Types
+        for dedication, ded_percentage in dedication_breakdown.items():
+            sunburst_data.append({
+                "id": dedication,
+                "parent": "Total Occasional",
+                "value": stats["ocasional"]["total_annual"] * ded_percentage
+            })
+        
+        # Add degree breakdown for each dedication type if available
+        if "highest_degree_breakdown" in stats["ocasional"]:
+            degree_breakdown = stats["ocasional"]["highest_degree_breakdown"]
+            for degree, percentage in degree_breakdown.items():
+                for dedication, ded_percentage in dedication_breakdown.items():
+                    value = stats["ocasional"]["total_annual"] * ded_percentage * percentage
+                    sunburst_data.append({
+                        "id": f"{dedication} - {degree}",
+                        "parent": dedication,
+                        "value": value
+                    })
+        branchvalues = "remainder"
     
     # Create DataFrame
     sunburst_df = pd.DataFrame(sunburst_data)
@@ -243,7 +264,8 @@ def plot_ocasional_payroll_breakdown(ocasional_data):
         parents="parent",
         values="value",
         title="Occasional Faculty Payroll Breakdown",
-        color_discrete_sequence=px.colors.qualitative.Bold
+        color_discrete_sequence=px.colors.qualitative.Bold,
+        branchvalues=branchvalues
     )
     
     # Update layout